@@ -1,25 +1,33 @@
-from datetime import datetime
-import uuid
-
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, JSON, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Boolean, text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from sahur_batch.database.connection import Base
 
 
+def utc_now():
+    """
+    Server-side current UTC timestamp, for timestamp column defaults.
+    
+    clock_timestamp() is used rather than now() so that rows written in
+    the same transaction still get distinct, ordered timestamps.
+    """
+    return func.timezone("utc", func.clock_timestamp())
+
+
 class Issue(Base):
     """Database model for issues."""
     __tablename__ = "issues"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()"))
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
-    status = Column(String(50), nullable=False)
+    status = Column(String(50), nullable=False, index=True)
     source = Column(String(50), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    event_transaction_id = Column(String(255), nullable=True)
-    additional_metadata = Column(JSON, nullable=True)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
+    event_transaction_id = Column(String(255), nullable=True, index=True)
+    additional_metadata = Column(JSONB, nullable=True)
 
     # Relationships
     tracking = relationship("IssueTracking", back_populates="issue", uselist=False)
@@ -30,15 +38,15 @@ class IssueTracking(Base):
     """Database model for issue tracking."""
     __tablename__ = "issue_tracking"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    issue_id = Column(String(36), ForeignKey("issues.id"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()"))
+    issue_id = Column(UUID(as_uuid=False), ForeignKey("issues.id"), nullable=False, index=True)
     status = Column(String(50), nullable=False)
     batch_process_id = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    cause_context = Column(JSON, nullable=True)
-    history_context = Column(JSON, nullable=True)
-    solution = Column(JSON, nullable=True)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
+    cause_context = Column(JSONB, nullable=True)
+    history_context = Column(JSONB, nullable=True)
+    solution = Column(JSONB, nullable=True)
     
     # Relationships
     issue = relationship("Issue", back_populates="tracking")
@@ -48,11 +56,11 @@ class IssueMessage(Base):
     """Database model for issue messages."""
     __tablename__ = "issue_messages"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    issue_id = Column(String(36), ForeignKey("issues.id"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()"))
+    issue_id = Column(UUID(as_uuid=False), ForeignKey("issues.id"), nullable=False, index=True)
     role = Column(String(50), nullable=False)  # system, user, assistant
     content = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, server_default=utc_now())
     
     # Relationships
     issue = relationship("Issue", back_populates="messages")
@@ -8,8 +8,9 @@ from contextlib import asynccontextmanager
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 
-from sahur_batch.database import get_db
+from sahur_batch.database import SessionLocal
 from sahur_batch.processor import IssueProcessor
+from sahur_batch.utils import close_session
 
 # Load environment variables
 load_dotenv()
@@ -33,9 +34,8 @@ async def process_issue(tracking_id: str) -> bool:
     Returns:
         True if processing was successful, False otherwise
     """
-    # Get database session
-    db_gen = get_db()
-    db = next(db_gen)
+    # Open database session
+    db = SessionLocal()
     
     try:
         # Initialize processor
@@ -61,8 +61,11 @@ async def process_issue(tracking_id: str) -> bool:
         return False
     
     finally:
+        # Close the shared MCP HTTP session
+        await close_session()
+        
         # Close database session
-        db_gen.close()
+        db.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -82,6 +85,21 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def install_event_loop() -> None:
+    """
+    Install uvloop as the asyncio event loop if it is available.
+    
+    Falls back to the default asyncio event loop otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop is not installed, using the default event loop")
+        return
+    
+    uvloop.install()
+
+
 def main() -> int:
     """
     Main entry point.
@@ -97,6 +115,7 @@ def main() -> int:
         tracking_id = args.tracking_id
         
         # Process issue
+        install_event_loop()
         success = asyncio.run(process_issue(tracking_id))
         
         return 0 if success else 1
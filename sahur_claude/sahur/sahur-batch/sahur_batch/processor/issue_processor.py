@@ -2,12 +2,12 @@ import os
 import json
 import logging
 import asyncio
-import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime
 import traceback
 
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from sahur_core.agents import IssueAgent
 from sahur_core.models import (
@@ -25,6 +25,18 @@ from sahur_batch.utils import WebSocketClient, MCPClient
 
 logger = logging.getLogger(__name__)
 
+# Status values used when updating the tracking record
+_STATUS_ANALYZING = IssueStatus.ANALYZING.value
+_STATUS_COMPLETED = IssueStatus.COMPLETED.value
+_STATUS_FAILED = IssueStatus.FAILED.value
+
+# Maximum number of traceback characters stored with an error message
+MAX_TRACEBACK_LENGTH = 4096
+
+# Raise on any relationship that is not loaded explicitly, so accidental
+# lazy loads (N+1 queries) surface during development and CI
+STRICT_LOADING = os.getenv("SAHUR_STRICT_LOADING") == "1"
+
 
 class IssueProcessor:
     """
@@ -58,9 +70,18 @@ class IssueProcessor:
             True if initialization was successful, False otherwise
         """
         try:
-            # Get the tracking record
+            # Get the tracking record together with its issue in one query
+            if STRICT_LOADING:
+                loader_options = [
+                    joinedload(IssueTracking.issue).raiseload("*"),
+                    raiseload("*"),
+                ]
+            else:
+                loader_options = [joinedload(IssueTracking.issue)]
+            
             self.tracking = (
                 self.db.query(IssueTracking)
+                .options(*loader_options)
                 .filter(IssueTracking.id == self.tracking_id)
                 .first()
             )
@@ -70,11 +91,7 @@ class IssueProcessor:
                 return False
             
             # Get the issue
-            self.issue = (
-                self.db.query(Issue)
-                .filter(Issue.id == self.tracking.issue_id)
-                .first()
-            )
+            self.issue = self.tracking.issue
             
             if not self.issue:
                 logger.error(f"Issue not found: {self.tracking.issue_id}")
@@ -92,13 +109,15 @@ class IssueProcessor:
             self.agent = IssueAgent(mcp_client=self.mcp_client)
             
             # Update tracking status
-            self.tracking.status = IssueStatus.ANALYZING.value
-            self.tracking.batch_process_id = str(os.getpid())
+            self._update_tracking(
+                status=_STATUS_ANALYZING,
+                batch_process_id=str(os.getpid()),
+            )
             self.db.commit()
             
             # Send status update
             if self.ws_client.connected:
-                await self.ws_client.send_status(IssueStatus.ANALYZING.value)
+                await self.ws_client.send_status(_STATUS_ANALYZING)
             
             # Log initialization
             logger.info(f"Initialized processor for issue {self.issue.id}")
@@ -122,48 +141,58 @@ class IssueProcessor:
                 "system",
                 f"Starting analysis of issue: {self.issue.title}"
             )
+            self.db.commit()
             
             # Convert DB issue to Core issue
             core_issue = self._convert_to_core_issue()
             
             # Gather context
             await self._gather_context(core_issue)
+            self.db.commit()
             
             # Analyze issue
             await self._analyze_issue(core_issue)
+            self.db.commit()
             
             # Update tracking status
-            self.tracking.status = IssueStatus.COMPLETED.value
-            self.db.commit()
+            self._update_tracking(status=_STATUS_COMPLETED)
             
             # Send status update
             if self.ws_client.connected:
-                await self.ws_client.send_status(IssueStatus.COMPLETED.value)
+                await self.ws_client.send_status(_STATUS_COMPLETED)
             
             # Send completion message
             await self._send_message(
                 "system",
                 "Analysis completed. Solution generated."
             )
+            self.db.commit()
             
             return True
         
         except Exception as e:
             logger.exception(f"Error processing issue: {e}")
             
+            # Discard any uncommitted work from the failed phase. Progress
+            # messages already sent to clients were committed before the
+            # work that could fail, so they survive the rollback.
+            self.db.rollback()
+            
             # Update tracking status
-            self.tracking.status = IssueStatus.FAILED.value
-            self.db.commit()
+            self._update_tracking(status=_STATUS_FAILED)
             
             # Send status update
             if self.ws_client.connected:
-                await self.ws_client.send_status(IssueStatus.FAILED.value)
+                await self.ws_client.send_status(_STATUS_FAILED)
             
-            # Send error message
-            await self._send_message(
-                "system",
-                f"Error processing issue: {str(e)}\n\n{traceback.format_exc()}"
-            )
+            # Send error message; the full traceback is already logged above
+            error_message = f"Error processing issue: {str(e)}"
+            if logger.isEnabledFor(logging.DEBUG):
+                error_trace = traceback.format_exc()[-MAX_TRACEBACK_LENGTH:]
+                error_message = f"{error_message}\n\n{error_trace}"
+            
+            await self._send_message("system", error_message)
+            self.db.commit()
             
             return False
         
@@ -198,6 +227,11 @@ class IssueProcessor:
         """
         Gather context information for the issue.
         
+        The cause and history context calls are independent, so they are
+        issued concurrently. Progress messages are committed before the
+        calls are made; the context writes are committed by the caller once
+        the phase is complete.
+        
         Args:
             core_issue: The core issue
         """
@@ -207,33 +241,49 @@ class IssueProcessor:
         )
         
         # Get cause context if event_transaction_id is available
-        if core_issue.event_transaction_id:
+        has_cause_context = bool(core_issue.event_transaction_id)
+        coros = []
+        
+        if has_cause_context:
             await self._send_message(
                 "system",
                 f"Getting cause context for transaction ID: {core_issue.event_transaction_id}"
             )
-            
+            coros.append(
+                self.mcp_client.get_cause_context(core_issue.event_transaction_id)
+            )
+        
+        # Get history context
+        await self._send_message(
+            "system",
+            "Getting history context..."
+        )
+        coros.append(self.mcp_client.get_history_context(core_issue.description))
+        self.db.commit()
+        
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        
+        if has_cause_context:
+            cause_context_data, history_context_data = results
+        else:
+            cause_context_data, history_context_data = None, results[0]
+        
+        # Convert and store the results
+        gathered = []
+        tracking_values = {}
+        
+        if has_cause_context:
             try:
-                cause_context_data = await self.mcp_client.get_cause_context(
-                    core_issue.event_transaction_id
-                )
+                if isinstance(cause_context_data, BaseException):
+                    raise cause_context_data
                 
                 # Convert to CauseContext
                 cause_context = CauseContext.model_validate(cause_context_data)
                 core_issue.context.cause_context = cause_context
                 
                 # Update tracking record
-                self.tracking.cause_context = cause_context_data
-                self.db.commit()
-                
-                # Send context to WebSocket
-                if self.ws_client.connected:
-                    await self.ws_client.send_context("cause_context", cause_context_data)
-                
-                await self._send_message(
-                    "system",
-                    "Cause context gathered successfully."
-                )
+                tracking_values["cause_context"] = cause_context_data
+                gathered.append(("cause_context", cause_context_data, "Cause"))
             
             except Exception as e:
                 logger.exception(f"Error getting cause context: {e}")
@@ -242,33 +292,17 @@ class IssueProcessor:
                     f"Error getting cause context: {str(e)}"
                 )
         
-        # Get history context
-        await self._send_message(
-            "system",
-            "Getting history context..."
-        )
-        
         try:
-            history_context_data = await self.mcp_client.get_history_context(
-                core_issue.description
-            )
+            if isinstance(history_context_data, BaseException):
+                raise history_context_data
             
             # Convert to HistoryContext
             history_context = HistoryContext.model_validate(history_context_data)
             core_issue.context.history_context = history_context
             
             # Update tracking record
-            self.tracking.history_context = history_context_data
-            self.db.commit()
-            
-            # Send context to WebSocket
-            if self.ws_client.connected:
-                await self.ws_client.send_context("history_context", history_context_data)
-            
-            await self._send_message(
-                "system",
-                "History context gathered successfully."
-            )
+            tracking_values["history_context"] = history_context_data
+            gathered.append(("history_context", history_context_data, "History"))
         
         except Exception as e:
             logger.exception(f"Error getting history context: {e}")
@@ -276,6 +310,19 @@ class IssueProcessor:
                 "system",
                 f"Error getting history context: {str(e)}"
             )
+        
+        if tracking_values:
+            self._update_tracking(**tracking_values)
+        
+        for context_type, context_data, label in gathered:
+            # Send context to WebSocket
+            if self.ws_client.connected:
+                await self.ws_client.send_context(context_type, context_data)
+            
+            await self._send_message(
+                "system",
+                f"{label} context gathered successfully."
+            )
     
     async def _analyze_issue(self, core_issue: CoreIssue) -> None:
         """
@@ -288,9 +335,10 @@ class IssueProcessor:
             "system",
             "Analyzing issue..."
         )
+        self.db.commit()
         
         # Set up message handler
-        def message_handler(message: Dict[str, Any]) -> None:
+        def message_handler(raw: bytes, message: Dict[str, Any]) -> None:
             if message.get("type") == "message" and message.get("role") == "user":
                 # Handle user message
                 content = message.get("content", "")
@@ -308,8 +356,7 @@ class IssueProcessor:
             solution_data = analyzed_issue.solution.model_dump()
             
             # Update tracking record
-            self.tracking.solution = solution_data
-            self.db.commit()
+            self._update_tracking(solution=solution_data)
             
             # Send solution to WebSocket
             if self.ws_client.connected:
@@ -317,20 +364,60 @@ class IssueProcessor:
             
             await self._send_message(
                 "assistant",
-                f"# Solution\n\n"
-                f"## Root Cause\n\n{analyzed_issue.solution.root_cause}\n\n"
-                f"## Explanation\n\n{analyzed_issue.solution.explanation}\n\n"
-                f"## Steps\n\n"
-                + "\n\n".join([
-                    f"### Step {step.step_number}: {step.description}\n\n"
-                    + (f"```\n{step.code_changes}\n```\n\n" if step.code_changes else "")
-                    + (f"Commands:\n```\n{chr(10).join(step.commands)}\n```" if step.commands else "")
-                    for step in analyzed_issue.solution.steps
-                ])
-                + "\n\n## References\n\n"
-                + "\n".join([f"- {ref}" for ref in analyzed_issue.solution.references])
+                self._format_solution(solution_data)
             )
     
+    def _format_solution(self, solution: Dict[str, Any]) -> str:
+        """
+        Format a solution as a Markdown message.
+        
+        Args:
+            solution: The dumped solution data, as stored on the tracking record
+            
+        Returns:
+            The Markdown representation of the solution
+        """
+        parts = [
+            "# Solution\n\n",
+            "## Root Cause\n\n", solution["root_cause"], "\n\n",
+            "## Explanation\n\n", solution["explanation"], "\n\n",
+            "## Steps\n\n",
+        ]
+        
+        for index, step in enumerate(solution["steps"]):
+            if index:
+                parts.append("\n\n")
+            
+            parts.append(f"### Step {step['step_number']}: {step['description']}\n\n")
+            
+            code_changes = step["code_changes"]
+            if code_changes:
+                parts.append(f"```\n{code_changes}\n```\n\n")
+            
+            if step["commands"]:
+                commands = "\n".join(step["commands"])
+                parts.append(f"Commands:\n```\n{commands}\n```")
+        
+        parts.append("\n\n## References\n\n")
+        parts.append("\n".join([f"- {ref}" for ref in solution["references"]]))
+        
+        return "".join(parts)
+    
+    def _update_tracking(self, **values: Any) -> None:
+        """
+        Update columns of the tracking record.
+        
+        This issues a single Core UPDATE rather than going through the
+        ORM unit of work, which is unnecessary for plain column writes.
+        
+        Args:
+            **values: The column values to set
+        """
+        table = IssueTracking.__table__
+        self.db.execute(
+            update(table).where(table.c.id == self.tracking_id).values(**values)
+        )
+    
     async def _send_message(self, role: str, content: str) -> None:
         """
         Send a message.
@@ -339,19 +426,18 @@ class IssueProcessor:
             role: The role of the message sender (system, user, assistant)
             content: The content of the message
         """
-        # Create message in database
-        message = IssueMessage(
-            id=str(uuid.uuid4()),
-            issue_id=self.issue.id,
-            role=role,
-            content=content,
+        # Create message in database. It is committed before the next step
+        # that can fail, so a rollback never drops a message clients saw.
+        self.db.execute(
+            IssueMessage.__table__.insert().values(
+                issue_id=self.issue.id,
+                role=role,
+                content=content,
+            )
         )
         
-        self.db.add(message)
-        self.db.commit()
-        
         # Send message to WebSocket
         if self.ws_client and self.ws_client.connected:
             await self.ws_client.send_message(role, content)
         
-        logger.debug(f"Sent message: {role} - {content[:100]}...")
+        logger.debug("Sent message: %s - %.100s...", role, content)
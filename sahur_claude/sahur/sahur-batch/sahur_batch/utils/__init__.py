@@ -1,4 +1,4 @@
 from sahur_batch.utils.websocket_client import WebSocketClient
-from sahur_batch.utils.mcp_client import MCPClient
+from sahur_batch.utils.mcp_client import MCPClient, MCPError, close_session
 
-__all__ = ["WebSocketClient", "MCPClient"]
+__all__ = ["WebSocketClient", "MCPClient", "MCPError", "close_session"]
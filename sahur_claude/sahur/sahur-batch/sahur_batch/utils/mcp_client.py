@@ -1,8 +1,11 @@
 import os
+import re
 import json
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import aiohttp
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -13,6 +16,73 @@ logger = logging.getLogger(__name__)
 # Get MCP server URL from environment variable or use a default
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8002")
 
+# Headers for requests with a pre-encoded JSON body
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared HTTP session used by all MCP clients in this process
+_session: Optional[aiohttp.ClientSession] = None
+
+# LRU cache of file contents keyed by (repo, path, ref), shared by all clients.
+# Only full 40-character commit SHAs are cached: branch and tag refs can
+# move, and short hex-only ref names like "deadbeef" are indistinguishable
+# from abbreviated SHAs.
+FILE_CACHE_MAXSIZE = 1024
+_COMMIT_SHA_PATTERN = re.compile(r"[0-9a-f]{40}")
+_file_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it if necessary.
+    
+    The session is backed by a pooled connector so that keep-alive
+    connections to the MCP server are reused across calls.
+    
+    Returns:
+        The shared HTTP session
+    """
+    global _session
+    
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=60, connect=10),
+        )
+    
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session."""
+    global _session
+    
+    if _session and not _session.closed:
+        await _session.close()
+    
+    _session = None
+
+
+class MCPError(Exception):
+    """Error returned by the MCP server for a tool call or resource access."""
+    
+    def __init__(self, message: str, status: int, body: bytes):
+        """
+        Initialize the error.
+        
+        Args:
+            message: A description of the failed operation
+            status: The HTTP status code of the response
+            body: The raw response body
+        """
+        self.status = status
+        self.body = body
+        super().__init__(f"{message} ({status}): {body.decode(errors='replace')}")
+
 
 class MCPClient:
     """
@@ -24,18 +94,19 @@ class MCPClient:
     def __init__(self):
         """Initialize the MCP client."""
         self.base_url = MCP_SERVER_URL
-        self.session = None
     
     async def __aenter__(self):
-        """Set up the client session when entering an async context."""
-        self.session = aiohttp.ClientSession()
+        """Set up the shared client session when entering an async context."""
+        await get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close the client session when exiting an async context."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """
+        Exit the async context.
+        
+        The shared session outlives individual clients and is closed
+        with close_session() when the process is done.
+        """
     
     async def call_tool(
         self,
@@ -53,23 +124,29 @@ class MCPClient:
             
         Returns:
             The result of the tool call
+            
+        Raises:
+            MCPError: If the MCP server returns an error response
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        session = await get_session()
         
         url = f"{self.base_url}/tools/{server_name}/{tool_name}"
         
         try:
-            async with self.session.post(url, json=arguments) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Error calling MCP tool: {error_text}")
-                    raise Exception(f"Error calling MCP tool: {error_text}")
-                
-                return await response.json()
+            # Read the body in one go so the connection returns to the pool
+            # before the response is parsed
+            async with session.post(url, data=orjson.dumps(arguments), headers=_JSON_HEADERS) as response:
+                status = response.status
+                body = await response.read()
         except Exception as e:
             logger.exception(f"Exception calling MCP tool: {e}")
             raise
+        
+        if status != 200:
+            logger.error("Error calling MCP tool: %s", body[:500])
+            raise MCPError("Error calling MCP tool", status, body)
+        
+        return orjson.loads(body)
     
     async def access_resource(
         self,
@@ -85,23 +162,29 @@ class MCPClient:
             
         Returns:
             The resource data
+            
+        Raises:
+            MCPError: If the MCP server returns an error response
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        session = await get_session()
         
         url = f"{self.base_url}/resources/{server_name}/{uri}"
         
         try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Error accessing MCP resource: {error_text}")
-                    raise Exception(f"Error accessing MCP resource: {error_text}")
-                
-                return await response.json()
+            # Read the body in one go so the connection returns to the pool
+            # before the response is parsed
+            async with session.get(url) as response:
+                status = response.status
+                body = await response.read()
         except Exception as e:
             logger.exception(f"Exception accessing MCP resource: {e}")
             raise
+        
+        if status != 200:
+            logger.error("Error accessing MCP resource: %s", body[:500])
+            raise MCPError("Error accessing MCP resource", status, body)
+        
+        return orjson.loads(body)
     
     async def get_cause_context(self, event_transaction_id: str) -> Dict[str, Any]:
         """
@@ -147,6 +230,13 @@ class MCPClient:
         Returns:
             The file content
         """
+        cache_key = (repo, path, ref)
+        cacheable = _COMMIT_SHA_PATTERN.fullmatch(ref) is not None
+        
+        if cacheable and cache_key in _file_cache:
+            _file_cache.move_to_end(cache_key)
+            return _file_cache[cache_key]
+        
         result = await self.call_tool(
             server_name="github",
             tool_name="getFileContent",
@@ -157,4 +247,11 @@ class MCPClient:
             }
         )
         
-        return result.get("content", "")
+        content = result.get("content", "")
+        
+        if cacheable:
+            _file_cache[cache_key] = content
+            if len(_file_cache) > FILE_CACHE_MAXSIZE:
+                _file_cache.popitem(last=False)
+        
+        return content
@@ -1,8 +1,9 @@
 import os
-import json
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Callable
+import orjson
 import websockets
 from dotenv import load_dotenv
 
@@ -14,6 +15,18 @@ logger = logging.getLogger(__name__)
 # Get server URL from environment variable or use a default
 SERVER_URL = os.getenv("SERVER_URL", "http://localhost:8000")
 
+# Base URL of the issue WebSocket endpoint
+WS_BASE_URL = (
+    SERVER_URL.replace("https://", "wss://").replace("http://", "ws://")
+    + "/api/issues/ws/"
+)
+
+# Coalesce outgoing messages into batched frames
+WS_BATCH_FRAMES = os.getenv("WS_BATCH_FRAMES", "false").lower() == "true"
+
+# How long to wait for more messages before sending a batched frame
+WS_FLUSH_INTERVAL = float(os.getenv("WS_FLUSH_INTERVAL", "0.002"))
+
 
 class WebSocketClient:
     """
@@ -23,29 +36,65 @@ class WebSocketClient:
     about the progress of issue analysis.
     """
     
-    def __init__(self, issue_id: str):
+    def __init__(
+        self,
+        issue_id: str,
+        batch_frames: bool = WS_BATCH_FRAMES,
+        flush_interval: float = WS_FLUSH_INTERVAL,
+    ):
         """
         Initialize the WebSocket client.
         
         Args:
             issue_id: The ID of the issue being analyzed
+            batch_frames: Whether to coalesce outgoing messages into a single
+                JSON-array frame. The send methods then report a message as
+                sent once it is queued; failures to deliver it are logged
+                and it is retried with the next batch.
+            flush_interval: How long to wait for more messages before
+                sending a batched frame, in seconds
         """
         self.issue_id = issue_id
-        self.ws_url = f"{SERVER_URL.replace('http://', 'ws://').replace('https://', 'wss://')}/api/issues/ws/{issue_id}"
+        self.ws_url = WS_BASE_URL + issue_id
         self.websocket = None
         self.connected = False
-        self.message_handler: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.message_handler: Optional[Callable[[bytes, Dict[str, Any]], None]] = None
+        self.batch_frames = batch_frames
+        self.flush_interval = flush_interval
+        self._outbox: Deque[bytes] = deque()
+        self._flush_event = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._stopping = False
     
     async def connect(self) -> bool:
         """
         Connect to the WebSocket server.
         
+        permessage-deflate stays enabled since context and solution
+        payloads are large JSON that compresses well. The websockets
+        library negotiates compression per connection, not per message,
+        so small status frames pay the (small) deflate cost too. The
+        incoming queue is unbounded because the server only sends
+        occasional user input, and the write buffer is raised so bursts
+        of updates don't block on backpressure.
+        
         Returns:
             True if the connection was successful, False otherwise
         """
         try:
-            self.websocket = await websockets.connect(self.ws_url)
+            self.websocket = await websockets.connect(
+                self.ws_url,
+                compression="deflate",
+                max_queue=None,
+                max_size=2**24,
+                write_limit=2**20,
+            )
             self.connected = True
+            
+            if self.batch_frames:
+                self._stopping = False
+                self._writer_task = asyncio.create_task(self._write_batches())
+            
             logger.info(f"Connected to WebSocket server: {self.ws_url}")
             return True
         except Exception as e:
@@ -54,12 +103,89 @@ class WebSocketClient:
             return False
     
     async def disconnect(self) -> None:
-        """Disconnect from the WebSocket server."""
+        """
+        Disconnect from the WebSocket server.
+        
+        The batch writer is asked to stop and awaited rather than cancelled,
+        so a batch being sent is never cut off, and anything still queued is
+        flushed before the connection is closed.
+        """
         if self.websocket and self.connected:
+            if self._writer_task:
+                self._stopping = True
+                self._flush_event.set()
+                await self._writer_task
+                self._writer_task = None
+            
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.exception(f"Error flushing pending messages: {e}")
+            
             await self.websocket.close()
             self.connected = False
             logger.info("Disconnected from WebSocket server")
     
+    async def flush(self) -> None:
+        """
+        Send any queued messages.
+        
+        A single queued message is sent as-is; several are sent together
+        as one JSON-array frame. Messages are only removed from the queue
+        once the frame has been sent, so a failed send keeps them queued.
+        """
+        count = len(self._outbox)
+        if not count:
+            return
+        
+        if count == 1:
+            frame = self._outbox[0]
+        else:
+            frame = b"[" + b",".join(self._outbox) + b"]"
+        
+        await self.websocket.send(frame.decode())
+        
+        for _ in range(count):
+            self._outbox.popleft()
+    
+    async def _write_batches(self) -> None:
+        """Send queued messages in batches until asked to stop."""
+        while True:
+            await self._flush_event.wait()
+            
+            # Give further messages a moment to join this batch
+            if not self._stopping:
+                await asyncio.sleep(self.flush_interval)
+            self._flush_event.clear()
+            
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.exception(f"Error sending batched messages: {e}")
+            
+            if self._stopping:
+                return
+    
+    async def _send(self, message: Dict[str, Any]) -> None:
+        """
+        Serialize and send a message, or queue it when batching is enabled.
+        
+        When batching, this returns once the message is queued; delivery
+        errors are logged by the batch writer instead of being raised here.
+        
+        Args:
+            message: The message to send
+        """
+        frame = orjson.dumps(message, default=str)
+        
+        # Frames are decoded to str so they go out as text frames, which
+        # is what the server's receive_json() expects
+        if self.batch_frames:
+            self._outbox.append(frame)
+            self._flush_event.set()
+        else:
+            await self.websocket.send(frame.decode())
+    
     async def send_message(self, role: str, content: str) -> bool:
         """
         Send a message to the server.
@@ -69,7 +195,8 @@ class WebSocketClient:
             content: The content of the message
             
         Returns:
-            True if the message was sent successfully, False otherwise
+            True if the message was sent (or queued, when batching
+            frames) successfully, False otherwise
         """
         if not self.websocket or not self.connected:
             logger.warning("Cannot send message: not connected to WebSocket server")
@@ -82,8 +209,8 @@ class WebSocketClient:
                 "content": content,
             }
             
-            await self.websocket.send(json.dumps(message))
-            logger.debug(f"Sent message: {message}")
+            await self._send(message)
+            logger.debug("Sent message: %r", message)
             return True
         except Exception as e:
             logger.exception(f"Error sending message: {e}")
@@ -97,7 +224,8 @@ class WebSocketClient:
             status: The new status
             
         Returns:
-            True if the status was sent successfully, False otherwise
+            True if the status was sent (or queued, when batching
+            frames) successfully, False otherwise
         """
         if not self.websocket or not self.connected:
             logger.warning("Cannot send status: not connected to WebSocket server")
@@ -109,8 +237,8 @@ class WebSocketClient:
                 "status": status,
             }
             
-            await self.websocket.send(json.dumps(message))
-            logger.debug(f"Sent status: {status}")
+            await self._send(message)
+            logger.debug("Sent status: %s", status)
             return True
         except Exception as e:
             logger.exception(f"Error sending status: {e}")
@@ -125,7 +253,8 @@ class WebSocketClient:
             context: The context information
             
         Returns:
-            True if the context was sent successfully, False otherwise
+            True if the context was sent (or queued, when batching
+            frames) successfully, False otherwise
         """
         if not self.websocket or not self.connected:
             logger.warning("Cannot send context: not connected to WebSocket server")
@@ -138,8 +267,8 @@ class WebSocketClient:
                 "context": context,
             }
             
-            await self.websocket.send(json.dumps(message))
-            logger.debug(f"Sent {context_type}")
+            await self._send(message)
+            logger.debug("Sent %s", context_type)
             return True
         except Exception as e:
             logger.exception(f"Error sending context: {e}")
@@ -153,7 +282,8 @@ class WebSocketClient:
             solution: The solution
             
         Returns:
-            True if the solution was sent successfully, False otherwise
+            True if the solution was sent (or queued, when batching
+            frames) successfully, False otherwise
         """
         if not self.websocket or not self.connected:
             logger.warning("Cannot send solution: not connected to WebSocket server")
@@ -165,7 +295,7 @@ class WebSocketClient:
                 "solution": solution,
             }
             
-            await self.websocket.send(json.dumps(message))
+            await self._send(message)
             logger.debug("Sent solution")
             return True
         except Exception as e:
@@ -177,7 +307,9 @@ class WebSocketClient:
         Listen for messages from the server.
         
         This method runs in a loop, receiving messages from the server
-        and calling the message handler if one is set.
+        and calling the message handler if one is set. The handler gets
+        both the raw JSON bytes and the decoded message, so handlers that
+        forward messages can pass the raw bytes on without re-encoding.
         """
         if not self.websocket or not self.connected:
             logger.warning("Cannot listen: not connected to WebSocket server")
@@ -185,22 +317,25 @@ class WebSocketClient:
         
         try:
             async for message in self.websocket:
+                raw = message.encode() if isinstance(message, str) else message
+                
                 try:
-                    data = json.loads(message)
-                    logger.debug(f"Received message: {data}")
+                    data = orjson.loads(raw)
+                    logger.debug("Received message: %r", data)
                     
                     if self.message_handler:
-                        self.message_handler(data)
-                except json.JSONDecodeError:
+                        self.message_handler(raw, data)
+                except orjson.JSONDecodeError:
                     logger.warning(f"Received invalid JSON: {message}")
         except Exception as e:
             logger.exception(f"Error listening for messages: {e}")
     
-    def set_message_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+    def set_message_handler(self, handler: Callable[[bytes, Dict[str, Any]], None]) -> None:
         """
         Set the message handler.
         
         Args:
-            handler: The function to call when a message is received
+            handler: The function to call with the raw and decoded message
+                when a message is received
         """
         self.message_handler = handler
@@ -17,7 +17,11 @@ from sahur_core.models import (
     SolutionStep,
 )
 from sahur_core.utils import MCPClient
-from sahur_core.workflows import create_analysis_workflow, run_analysis_workflow
+from sahur_core.workflows import (
+    create_analysis_workflow,
+    run_analysis_workflow,
+    arun_analysis_workflow,
+)
 
 __version__ = "0.1.0"
 
@@ -35,4 +39,5 @@ __all__ = [
     "MCPClient",
     "create_analysis_workflow",
     "run_analysis_workflow",
+    "arun_analysis_workflow",
 ]
@@ -1,9 +1,10 @@
-from typing import Dict, List, Any, Optional
-import json
+from typing import Deque, Dict, List, Any, Optional
 import asyncio
+from collections import deque
 from datetime import datetime
 
-from langchain.schema import HumanMessage, AIMessage
+import orjson
+from langchain.schema import HumanMessage, AIMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
 from sahur_core.models import (
@@ -17,6 +18,29 @@ from sahur_core.models import (
 )
 from sahur_core.context import ContextManager
 
+# LangChain message class for each conversation role
+_MESSAGE_CLASSES = {
+    "system": SystemMessage,
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
+# Maximum number of messages kept after the initial system and issue prompts
+MAX_HISTORY = 64
+
+# Prompts that are the same for every issue
+_SYSTEM_PROMPT = (
+    "You are an expert software engineer tasked with analyzing and resolving issues. "
+    "Your goal is to identify the root cause of the issue and provide a detailed solution."
+)
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+_USER_TEMPLATE = (
+    "I need to analyze the following issue:\n\n"
+    "ID: {}\n"
+    "Title: {}\n"
+    "Description: {}"
+)
+
 
 class IssueAgent:
     """
@@ -31,6 +55,7 @@ class IssueAgent:
         model_name: str = "gpt-4o",
         context_manager: Optional[ContextManager] = None,
         mcp_client=None,
+        max_history: int = MAX_HISTORY,
     ):
         """
         Initialize the issue agent.
@@ -39,11 +64,20 @@ class IssueAgent:
             model_name: The name of the LLM model to use
             context_manager: Manager for context information
             mcp_client: Client for interacting with MCP servers
+            max_history: The maximum number of messages kept after the
+                initial system and issue prompts
         """
         self.llm = ChatOpenAI(model=model_name)
         self.context_manager = context_manager or ContextManager(mcp_client)
         self.mcp_client = mcp_client
-        self.messages = []
+        self.max_history = max_history
+        
+        # The initial system and issue prompts are kept separately so they
+        # are never dropped from the bounded history
+        self.seed_messages: List[Dict[str, str]] = []
+        self.lc_seed_messages: List[Any] = []
+        self.messages: Deque[Dict[str, str]] = deque(maxlen=max_history)
+        self.lc_messages: Deque[Any] = deque(maxlen=max_history)
     
     async def analyze_issue(self, issue: Issue) -> Issue:
         """
@@ -60,22 +94,14 @@ class IssueAgent:
         issue.updated_at = datetime.now()
         
         # Initialize messages
-        self.messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are an expert software engineer tasked with analyzing and resolving issues. "
-                    "Your goal is to identify the root cause of the issue and provide a detailed solution."
-                )
-            },
-            {
-                "role": "user",
-                "content": f"I need to analyze the following issue:\n\n"
-                           f"ID: {issue.issue_id}\n"
-                           f"Title: {issue.title}\n"
-                           f"Description: {issue.description}"
-            }
+        issue_prompt = _USER_TEMPLATE.format(issue.issue_id, issue.title, issue.description)
+        self.seed_messages = [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": issue_prompt},
         ]
+        self.lc_seed_messages = [_SYSTEM_MESSAGE, HumanMessage(content=issue_prompt)]
+        self.messages.clear()
+        self.lc_messages.clear()
         
         # Gather context information
         await self._gather_context(issue)
@@ -101,21 +127,27 @@ class IssueAgent:
             issue: The issue to gather context for
         """
         # Add a message indicating that we're gathering context
-        self.messages.append({
-            "role": "assistant",
-            "content": "I'll analyze this issue. First, let me gather some context information."
-        })
+        self._push(
+            "assistant",
+            "I'll analyze this issue. First, let me gather some context information."
+        )
+        
+        # Get cause context (if event_transaction_id is available) and
+        # history context concurrently
+        history_coro = self.context_manager.get_history_context(issue.description)
         
-        # Get cause context if event_transaction_id is available
         if issue.event_transaction_id:
-            cause_context = await self.context_manager.get_cause_context(issue.event_transaction_id)
+            cause_context, history_context = await asyncio.gather(
+                self.context_manager.get_cause_context(issue.event_transaction_id),
+                history_coro,
+            )
             issue.context.cause_context = cause_context
             
             # Add cause context to messages
             self._add_context_to_messages("Cause Context", cause_context.dict())
+        else:
+            history_context = await history_coro
         
-        # Get history context
-        history_context = await self.context_manager.get_history_context(issue.description)
         issue.context.history_context = history_context
         
         # Add history context to messages
@@ -130,13 +162,39 @@ class IssueAgent:
             context_data: The context data to add
         """
         # Format the context data as a string
-        context_str = json.dumps(context_data, indent=2, default=str)
+        context_str = orjson.dumps(
+            context_data, option=orjson.OPT_INDENT_2, default=str
+        ).decode()
         
         # Add the context to the messages
-        self.messages.append({
-            "role": "user",
-            "content": f"Here is the {context_type} information:\n\n```json\n{context_str}\n```"
-        })
+        self._push(
+            "user",
+            f"Here is the {context_type} information:\n\n```json\n{context_str}\n```"
+        )
+    
+    def _push(self, role: str, content: str) -> None:
+        """
+        Append a message to the conversation.
+        
+        The LangChain representation is kept alongside the plain message
+        so it does not have to be rebuilt before every LLM call. Once
+        max_history messages are stored, the oldest is dropped.
+        
+        Args:
+            role: The role of the message sender (system, user, assistant)
+            content: The content of the message
+        """
+        self.messages.append({"role": role, "content": content})
+        self.lc_messages.append(_MESSAGE_CLASSES[role](content=content))
+    
+    def _llm_messages(self) -> List[Any]:
+        """
+        Get the conversation to send to the LLM.
+        
+        Returns:
+            The initial prompts followed by the retained history
+        """
+        return self.lc_seed_messages + list(self.lc_messages)
     
     async def _perform_analysis(self) -> str:
         """
@@ -146,32 +204,17 @@ class IssueAgent:
             The analysis result
         """
         # Add a prompt for analysis
-        self.messages.append({
-            "role": "user",
-            "content": (
-                "Based on the context information provided, please analyze this issue and identify the root cause. "
-                "Consider the stack trace, HTTP requests/responses, logs, and similar historical issues."
-            )
-        })
-        
-        # Convert messages to LangChain format
-        lc_messages = []
-        for msg in self.messages:
-            if msg["role"] == "system":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "user":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                lc_messages.append(AIMessage(content=msg["content"]))
+        self._push(
+            "user",
+            "Based on the context information provided, please analyze this issue and identify the root cause. "
+            "Consider the stack trace, HTTP requests/responses, logs, and similar historical issues."
+        )
         
         # Get response from LLM
-        response = self.llm.invoke(lc_messages)
+        response = await self.llm.ainvoke(self._llm_messages())
         
         # Add the response to messages
-        self.messages.append({
-            "role": "assistant",
-            "content": response.content
-        })
+        self._push("assistant", response.content)
         
         return response.content
     
@@ -186,33 +229,18 @@ class IssueAgent:
             A Solution object
         """
         # Add a prompt for solution generation
-        self.messages.append({
-            "role": "user",
-            "content": (
-                "Based on your analysis, please generate a detailed solution for this issue. "
-                "Include specific steps to resolve the issue, any code changes needed, "
-                "and commands to execute if applicable."
-            )
-        })
-        
-        # Convert messages to LangChain format
-        lc_messages = []
-        for msg in self.messages:
-            if msg["role"] == "system":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "user":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                lc_messages.append(AIMessage(content=msg["content"]))
+        self._push(
+            "user",
+            "Based on your analysis, please generate a detailed solution for this issue. "
+            "Include specific steps to resolve the issue, any code changes needed, "
+            "and commands to execute if applicable."
+        )
         
         # Get response from LLM
-        response = self.llm.invoke(lc_messages)
+        response = await self.llm.ainvoke(self._llm_messages())
         
         # Add the response to messages
-        self.messages.append({
-            "role": "assistant",
-            "content": response.content
-        })
+        self._push("assistant", response.content)
         
         # Parse the solution from the response
         # In a real implementation, this would parse the response to extract structured data
@@ -288,10 +316,7 @@ class IssueAgent:
         issue.updated_at = datetime.now()
         
         # Add the question to messages
-        self.messages.append({
-            "role": "assistant",
-            "content": question
-        })
+        self._push("assistant", question)
     
     async def process_user_input(self, issue: Issue, user_input: str) -> None:
         """
@@ -306,7 +331,4 @@ class IssueAgent:
         issue.updated_at = datetime.now()
         
         # Add the user input to messages
-        self.messages.append({
-            "role": "user",
-            "content": user_input
-        })
+        self._push("user", user_input)
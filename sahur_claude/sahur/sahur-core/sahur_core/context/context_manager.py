@@ -14,6 +14,88 @@ from sahur_core.models import (
 )
 
 
+# Dummy contexts for demonstration, validated once. Callers get deep copies,
+# since the models hold mutable lists and dicts. The HTTP request and
+# response timestamps are placeholders, set to the current time per call.
+_DUMMY_CAUSE_CONTEXT = CauseContext(
+    stack_trace=StackTrace(
+        exception_type="java.lang.NullPointerException",
+        exception_message="Cannot invoke method getUser() on null object",
+        frames=[
+            {
+                "file_path": "com/example/service/UserService.java",
+                "line_number": 42,
+                "method_name": "processUserRequest",
+                "code_line": "return userRequest.getUser().getId();"
+            },
+            {
+                "file_path": "com/example/controller/UserController.java",
+                "line_number": 28,
+                "method_name": "handleRequest",
+                "code_line": "UserDTO user = userService.processUserRequest(request);"
+            }
+        ]
+    ),
+    http_requests=[
+        HttpRequest(
+            method="POST",
+            url="https://api.example.com/users",
+            headers={"Content-Type": "application/json", "Authorization": "Bearer ..."},
+            body={"action": "getUser", "params": {}},
+            timestamp=datetime(2025, 5, 22, 15, 20, 30)
+        )
+    ],
+    http_responses=[
+        HttpResponse(
+            status_code=500,
+            headers={"Content-Type": "application/json"},
+            body={"error": "Internal Server Error", "message": "An unexpected error occurred"},
+            timestamp=datetime(2025, 5, 22, 15, 20, 30)
+        )
+    ],
+    logs=[
+        "2025-05-22T15:20:30.123Z ERROR [UserService] - Exception while processing user request",
+        "2025-05-22T15:20:30.124Z ERROR [UserService] - java.lang.NullPointerException: Cannot invoke method getUser() on null object",
+        "2025-05-22T15:20:30.125Z ERROR [UserService] - at com.example.service.UserService.processUserRequest(UserService.java:42)"
+    ]
+)
+
+_DUMMY_HISTORY_CONTEXT = HistoryContext(
+    similar_issues=[
+        HistoricalIssue(
+            issue_id="ISSUE-456",
+            title="NullPointerException in UserService.processUserRequest",
+            description="Users are getting 500 errors when trying to access their profile",
+            root_cause="The UserRequest object was not properly initialized before calling getUser()",
+            solution="Added null check before calling getUser() and proper error handling",
+            similarity_score=0.92,
+            resolved_at=datetime(2025, 4, 15, 10, 30)
+        ),
+        HistoricalIssue(
+            issue_id="ISSUE-789",
+            title="500 error on user profile page",
+            description="After the latest deployment, users are unable to view their profiles",
+            root_cause="Database connection timeout due to increased load",
+            solution="Increased connection pool size and added retry mechanism",
+            similarity_score=0.78,
+            resolved_at=datetime(2025, 5, 1, 14, 45)
+        )
+    ],
+    relevant_code_changes={
+        "com/example/service/UserService.java": "Commit abc123: Refactored user request handling",
+        "com/example/controller/UserController.java": "Commit def456: Updated API endpoint parameters"
+    },
+    deployment_events=[
+        {
+            "id": "DEPLOY-123",
+            "timestamp": datetime(2025, 5, 21, 18, 0),
+            "version": "v2.3.4",
+            "changes": ["Updated user service", "Fixed authentication bug"]
+        }
+    ]
+)
+
+
 class ContextManager:
     """
     Manages context information for issue analysis.
@@ -48,49 +130,16 @@ class ContextManager:
             # For now, we'll return a dummy context
             pass
         
-        # Create a dummy cause context for demonstration
-        return CauseContext(
-            stack_trace=StackTrace(
-                exception_type="java.lang.NullPointerException",
-                exception_message="Cannot invoke method getUser() on null object",
-                frames=[
-                    {
-                        "file_path": "com/example/service/UserService.java",
-                        "line_number": 42,
-                        "method_name": "processUserRequest",
-                        "code_line": "return userRequest.getUser().getId();"
-                    },
-                    {
-                        "file_path": "com/example/controller/UserController.java",
-                        "line_number": 28,
-                        "method_name": "handleRequest",
-                        "code_line": "UserDTO user = userService.processUserRequest(request);"
-                    }
-                ]
-            ),
-            http_requests=[
-                HttpRequest(
-                    method="POST",
-                    url="https://api.example.com/users",
-                    headers={"Content-Type": "application/json", "Authorization": "Bearer ..."},
-                    body={"action": "getUser", "params": {}},
-                    timestamp=datetime.now()
-                )
-            ],
-            http_responses=[
-                HttpResponse(
-                    status_code=500,
-                    headers={"Content-Type": "application/json"},
-                    body={"error": "Internal Server Error", "message": "An unexpected error occurred"},
-                    timestamp=datetime.now()
-                )
-            ],
-            logs=[
-                "2025-05-22T15:20:30.123Z ERROR [UserService] - Exception while processing user request",
-                "2025-05-22T15:20:30.124Z ERROR [UserService] - java.lang.NullPointerException: Cannot invoke method getUser() on null object",
-                "2025-05-22T15:20:30.125Z ERROR [UserService] - at com.example.service.UserService.processUserRequest(UserService.java:42)"
-            ]
-        )
+        # Return a copy of the dummy cause context for demonstration
+        cause_context = _DUMMY_CAUSE_CONTEXT.model_copy(deep=True)
+        
+        now = datetime.now()
+        for http_request in cause_context.http_requests:
+            http_request.timestamp = now
+        for http_response in cause_context.http_responses:
+            http_response.timestamp = now
+        
+        return cause_context
     
     async def get_history_context(self, issue_description: str) -> HistoryContext:
         """
@@ -107,41 +156,8 @@ class ContextManager:
             # For now, we'll return a dummy context
             pass
         
-        # Create a dummy history context for demonstration
-        return HistoryContext(
-            similar_issues=[
-                HistoricalIssue(
-                    issue_id="ISSUE-456",
-                    title="NullPointerException in UserService.processUserRequest",
-                    description="Users are getting 500 errors when trying to access their profile",
-                    root_cause="The UserRequest object was not properly initialized before calling getUser()",
-                    solution="Added null check before calling getUser() and proper error handling",
-                    similarity_score=0.92,
-                    resolved_at=datetime(2025, 4, 15, 10, 30)
-                ),
-                HistoricalIssue(
-                    issue_id="ISSUE-789",
-                    title="500 error on user profile page",
-                    description="After the latest deployment, users are unable to view their profiles",
-                    root_cause="Database connection timeout due to increased load",
-                    solution="Increased connection pool size and added retry mechanism",
-                    similarity_score=0.78,
-                    resolved_at=datetime(2025, 5, 1, 14, 45)
-                )
-            ],
-            relevant_code_changes={
-                "com/example/service/UserService.java": "Commit abc123: Refactored user request handling",
-                "com/example/controller/UserController.java": "Commit def456: Updated API endpoint parameters"
-            },
-            deployment_events=[
-                {
-                    "id": "DEPLOY-123",
-                    "timestamp": datetime(2025, 5, 21, 18, 0),
-                    "version": "v2.3.4",
-                    "changes": ["Updated user service", "Fixed authentication bug"]
-                }
-            ]
-        )
+        # Return a copy of the dummy history context for demonstration
+        return _DUMMY_HISTORY_CONTEXT.model_copy(deep=True)
     
     async def enrich_context(self, cause_context: CauseContext) -> CauseContext:
         """
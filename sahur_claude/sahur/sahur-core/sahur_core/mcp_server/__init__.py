@@ -4,13 +4,19 @@ Mock MCP server module.
 This module provides mock implementations of MCP server classes and functions.
 """
 
-from typing import Dict, Any, List, Optional, Callable
+import sys
+import asyncio
+from typing import Dict, Any, List, Optional, Awaitable, Callable, Tuple
 import json
 
+import orjson
+
 
 class Schema:
     """Schema for MCP tools and resources."""
     
+    __slots__ = ("schema",)
+    
     def __init__(self, schema: Dict[str, Any]):
         """
         Initialize the schema.
@@ -24,6 +30,8 @@ class Schema:
 class Tool:
     """Tool for MCP server."""
     
+    __slots__ = ("name", "description", "handler", "input_schema", "output_schema", "raw_handler")
+    
     def __init__(
         self,
         name: str,
@@ -31,6 +39,7 @@ class Tool:
         handler: Callable[[Dict[str, Any]], Any],
         input_schema: Schema,
         output_schema: Schema,
+        raw_handler: Optional[Callable[[Dict[str, Any]], Awaitable[bytes]]] = None,
     ):
         """
         Initialize the tool.
@@ -41,17 +50,22 @@ class Tool:
             handler: The handler function for the tool
             input_schema: The input schema for the tool
             output_schema: The output schema for the tool
+            raw_handler: Optional handler that returns the result already
+                encoded as JSON, used when the result is sent over the wire
         """
         self.name = name
         self.description = description
         self.handler = handler
         self.input_schema = input_schema
         self.output_schema = output_schema
+        self.raw_handler = raw_handler
 
 
 class Resource:
     """Resource for MCP server."""
     
+    __slots__ = ("uri", "description", "handler", "schema")
+    
     def __init__(
         self,
         uri: str,
@@ -74,6 +88,41 @@ class Resource:
         self.schema = schema
 
 
+def _tool_descriptor(tool: Tool) -> Dict[str, Any]:
+    """
+    Describe a tool for listings.
+    
+    Args:
+        tool: The tool to describe
+        
+    Returns:
+        The tool information
+    """
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "input_schema": tool.input_schema.schema,
+        "output_schema": tool.output_schema.schema,
+    }
+
+
+def _resource_descriptor(resource: Resource) -> Dict[str, Any]:
+    """
+    Describe a resource for listings.
+    
+    Args:
+        resource: The resource to describe
+        
+    Returns:
+        The resource information
+    """
+    return {
+        "uri": resource.uri,
+        "description": resource.description,
+        "schema": resource.schema.schema,
+    }
+
+
 class MCPServer:
     """MCP server."""
     
@@ -89,6 +138,15 @@ class MCPServer:
         self.description = description
         self.tools: Dict[str, Tool] = {}
         self.resources: Dict[str, Resource] = {}
+        
+        # Handlers by name, kept alongside the registries for dispatch
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._raw_tool_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[bytes]]] = {}
+        
+        # Tool and resource descriptors for listings, built as they are added
+        self.tool_descriptors: List[Dict[str, Any]] = []
+        self.resource_descriptors: List[Dict[str, Any]] = []
+        self._resource_handlers: Dict[str, Callable[[], Any]] = {}
     
     def add_tool(self, tool: Tool) -> None:
         """
@@ -97,7 +155,20 @@ class MCPServer:
         Args:
             tool: The tool to add
         """
-        self.tools[tool.name] = tool
+        name = sys.intern(tool.name)
+        replaced = name in self.tools
+        self.tools[name] = tool
+        self._tool_handlers[name] = tool.handler
+        
+        if tool.raw_handler is not None:
+            self._raw_tool_handlers[name] = tool.raw_handler
+        else:
+            self._raw_tool_handlers.pop(name, None)
+        
+        if replaced:
+            self.tool_descriptors = [_tool_descriptor(tool) for tool in self.tools.values()]
+        else:
+            self.tool_descriptors.append(_tool_descriptor(tool))
     
     def add_resource(self, resource: Resource) -> None:
         """
@@ -106,4 +177,93 @@ class MCPServer:
         Args:
             resource: The resource to add
         """
-        self.resources[resource.uri] = resource
+        uri = sys.intern(resource.uri)
+        replaced = uri in self.resources
+        self.resources[uri] = resource
+        self._resource_handlers[uri] = resource.handler
+        
+        if replaced:
+            self.resource_descriptors = [
+                _resource_descriptor(resource) for resource in self.resources.values()
+            ]
+        else:
+            self.resource_descriptors.append(_resource_descriptor(resource))
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Call a tool on the server.
+        
+        Args:
+            name: The name of the tool
+            arguments: The arguments for the tool
+            
+        Returns:
+            The result of the tool call
+            
+        Raises:
+            ValueError: If the tool is not registered
+        """
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            raise ValueError(f"Tool not found: {name}")
+        
+        return await handler(arguments)
+    
+    async def call_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Call several tools on the server concurrently.
+        
+        Args:
+            calls: The tool calls, as (tool name, arguments) pairs
+            
+        Returns:
+            The results of the tool calls, in order
+            
+        Raises:
+            ValueError: If any of the tools is not registered
+        """
+        return list(await asyncio.gather(*(
+            self.call_tool(name, arguments) for name, arguments in calls
+        )))
+    
+    async def call_tool_raw(self, name: str, arguments: Dict[str, Any]) -> bytes:
+        """
+        Call a tool on the server and get the result encoded as JSON.
+        
+        Tools with a raw handler return their pre-encoded result directly;
+        for other tools the result is encoded here.
+        
+        Args:
+            name: The name of the tool
+            arguments: The arguments for the tool
+            
+        Returns:
+            The result of the tool call as JSON bytes
+            
+        Raises:
+            ValueError: If the tool is not registered
+        """
+        raw_handler = self._raw_tool_handlers.get(name)
+        if raw_handler is not None:
+            return await raw_handler(arguments)
+        
+        return orjson.dumps(await self.call_tool(name, arguments))
+    
+    async def access_resource(self, uri: str) -> Any:
+        """
+        Access a resource on the server.
+        
+        Args:
+            uri: The URI of the resource
+            
+        Returns:
+            The resource data
+            
+        Raises:
+            ValueError: If the resource is not registered
+        """
+        handler = self._resource_handlers.get(uri)
+        if handler is None:
+            raise ValueError(f"Resource not found: {uri}")
+        
+        return await handler()
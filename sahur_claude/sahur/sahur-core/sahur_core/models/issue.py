@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 
 from pydantic import BaseModel, Field
 
@@ -76,13 +76,18 @@ class DatabaseError(BaseModel):
 
 
 class CauseContext(BaseModel):
-    """Context information about the cause of an issue."""
+    """
+    Context information about the cause of an issue.
+    
+    Collections are tuples since the context is read-only once gathered,
+    which lets empty fields share one default instead of allocating.
+    """
     stack_trace: Optional[StackTrace] = None
-    http_requests: List[HttpRequest] = Field(default_factory=list)
-    http_responses: List[HttpResponse] = Field(default_factory=list)
-    kafka_messages: List[KafkaMessage] = Field(default_factory=list)
-    database_errors: List[DatabaseError] = Field(default_factory=list)
-    logs: List[str] = Field(default_factory=list)
+    http_requests: Tuple[HttpRequest, ...] = ()
+    http_responses: Tuple[HttpResponse, ...] = ()
+    kafka_messages: Tuple[KafkaMessage, ...] = ()
+    database_errors: Tuple[DatabaseError, ...] = ()
+    logs: Tuple[str, ...] = ()
     additional_context: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -98,10 +103,14 @@ class HistoricalIssue(BaseModel):
 
 
 class HistoryContext(BaseModel):
-    """Context information about similar historical issues."""
-    similar_issues: List[HistoricalIssue] = Field(default_factory=list)
+    """
+    Context information about similar historical issues.
+    
+    Collections are tuples since the context is read-only once gathered.
+    """
+    similar_issues: Tuple[HistoricalIssue, ...] = ()
     relevant_code_changes: Dict[str, str] = Field(default_factory=dict)
-    deployment_events: List[Dict[str, Any]] = Field(default_factory=list)
+    deployment_events: Tuple[Dict[str, Any], ...] = ()
 
 
 class IssueContext(BaseModel):
@@ -1,3 +1,10 @@
-from sahur_core.utils.mcp_client import MCPClient
+from sahur_core.utils.mcp_client import MCPClient, get_session, close_session
+from sahur_core.utils.concurrency import AdaptiveConcurrencyLimiter, ServiceOverloadError
 
-__all__ = ["MCPClient"]
+__all__ = [
+    "MCPClient",
+    "get_session",
+    "close_session",
+    "AdaptiveConcurrencyLimiter",
+    "ServiceOverloadError",
+]
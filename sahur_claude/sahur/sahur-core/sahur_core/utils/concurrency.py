@@ -0,0 +1,92 @@
+import asyncio
+from typing import Optional
+
+
+class ServiceOverloadError(Exception):
+    """Raised when a remote service signals that it is overloaded."""
+    
+    def __init__(self, message: str, status: int):
+        """
+        Initialize the error.
+        
+        Args:
+            message: A description of the failed operation
+            status: The HTTP status code of the response
+        """
+        self.status = status
+        super().__init__(f"{message} ({status})")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limiter that adapts its limit to the remote service.
+    
+    The limit follows additive-increase/multiplicative-decrease (AIMD), like
+    TCP congestion control: each successful call raises it by roughly one
+    per window of calls, and each ServiceOverloadError cuts it by a fixed
+    fraction. Use it as an async context manager around each call.
+    """
+    
+    def __init__(
+        self,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 256,
+        overload_decrease: float = 0.1,
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            initial_concurrency: The starting concurrency limit
+            min_concurrency: The lowest the limit can drop to
+            max_concurrency: The highest the limit can grow to
+            overload_decrease: The fraction of the limit removed on overload
+        """
+        self.limit = float(initial_concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.overload_decrease = overload_decrease
+        self.in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+    
+    def _get_condition(self) -> asyncio.Condition:
+        """
+        Get the condition used to wait for a free slot.
+        
+        It is created on first use so that it belongs to the running loop.
+        
+        Returns:
+            The condition
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+    
+    async def __aenter__(self):
+        """Wait for a free slot under the current limit."""
+        condition = self._get_condition()
+        
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Release the slot and adjust the limit based on the outcome."""
+        condition = self._get_condition()
+        
+        async with condition:
+            self.in_flight -= 1
+            
+            if isinstance(exc_val, ServiceOverloadError):
+                self.limit = max(
+                    self.min_concurrency, self.limit * (1 - self.overload_decrease)
+                )
+            elif exc_type is None:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            
+            condition.notify_all()
+        
+        return False
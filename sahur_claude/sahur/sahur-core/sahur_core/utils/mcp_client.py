@@ -1,10 +1,189 @@
-from typing import Dict, List, Any, Optional
+import os
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Type
 import json
 import aiohttp
 import logging
 
+import orjson
+from pydantic import BaseModel
+
+from sahur_core.models import CauseContext, HistoryContext
+from sahur_core.utils.concurrency import AdaptiveConcurrencyLimiter, ServiceOverloadError
+from sahur_core.models.issue import (
+    StackTrace,
+    StackTraceFrame,
+    HttpRequest,
+    HttpResponse,
+    KafkaMessage,
+    DatabaseError,
+    HistoricalIssue,
+)
+
 logger = logging.getLogger(__name__)
 
+# Validate context payloads from the MCP server. When disabled, trusted
+# payloads are turned into models without validation.
+VALIDATE_MCP = os.getenv("SAHUR_VALIDATE_MCP") == "1"
+
+# Headers for requests with a pre-encoded JSON body
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared HTTP session used by all MCP clients in this process
+_session: Optional[aiohttp.ClientSession] = None
+
+# Adaptive concurrency limiters for tool calls, keyed by server name
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+# Retries for tool calls rejected because the server is overloaded
+MAX_OVERLOAD_RETRIES = 3
+OVERLOAD_BACKOFF = 0.1
+
+# Statuses that mean the server is overloaded rather than that the call failed.
+# sahur-mcp reports tool errors as 500, which must not be retried.
+OVERLOAD_STATUSES = frozenset({429, 503, 504})
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it if necessary.
+    
+    The session is backed by a pooled connector so that keep-alive
+    connections to MCP servers are reused across clients and calls.
+    
+    Returns:
+        The shared HTTP session
+    """
+    global _session
+    
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=1000,
+                limit_per_host=200,
+                ttl_dns_cache=600,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=180),
+        )
+    
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session."""
+    global _session
+    
+    if _session and not _session.closed:
+        await _session.close()
+    
+    _session = None
+
+
+def _get_limiter(server_name: str) -> AdaptiveConcurrencyLimiter:
+    """
+    Get the concurrency limiter for an MCP server, creating it if necessary.
+    
+    Args:
+        server_name: The name of the MCP server
+        
+    Returns:
+        The concurrency limiter
+    """
+    limiter = _limiters.get(server_name)
+    if limiter is None:
+        limiter = _limiters[server_name] = AdaptiveConcurrencyLimiter()
+    return limiter
+
+
+def _to_datetime(value: Any) -> Any:
+    """
+    Convert an ISO 8601 string to a datetime.
+    
+    Args:
+        value: The value to convert
+        
+    Returns:
+        The datetime, or the value unchanged if it is not a string
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def _construct_all(
+    model: Type[BaseModel], items: List[Dict[str, Any]], datetime_field: str
+) -> Tuple[Any, ...]:
+    """
+    Build models from trusted data without validation.
+    
+    Args:
+        model: The model class to build
+        items: The data for each model
+        datetime_field: The name of the field holding a timestamp
+        
+    Returns:
+        The built models
+    """
+    return tuple(
+        model.model_construct(
+            **{**item, datetime_field: _to_datetime(item.get(datetime_field))}
+        )
+        for item in items
+    )
+
+
+def _construct_cause_context(data: Dict[str, Any]) -> CauseContext:
+    """
+    Build a CauseContext from a trusted payload without validation.
+    
+    Args:
+        data: The decoded cause context payload
+        
+    Returns:
+        The cause context
+    """
+    stack_trace = data.get("stack_trace")
+    if stack_trace is not None:
+        stack_trace = StackTrace.model_construct(
+            **{
+                **stack_trace,
+                "frames": [
+                    StackTraceFrame.model_construct(**frame)
+                    for frame in stack_trace.get("frames", [])
+                ],
+            }
+        )
+    
+    return CauseContext.model_construct(
+        stack_trace=stack_trace,
+        http_requests=_construct_all(HttpRequest, data.get("http_requests", []), "timestamp"),
+        http_responses=_construct_all(HttpResponse, data.get("http_responses", []), "timestamp"),
+        kafka_messages=_construct_all(KafkaMessage, data.get("kafka_messages", []), "timestamp"),
+        database_errors=_construct_all(DatabaseError, data.get("database_errors", []), "timestamp"),
+        logs=tuple(data.get("logs", ())),
+        additional_context=data.get("additional_context", {}),
+    )
+
+
+def _construct_history_context(data: Dict[str, Any]) -> HistoryContext:
+    """
+    Build a HistoryContext from a trusted payload without validation.
+    
+    Args:
+        data: The decoded history context payload
+        
+    Returns:
+        The history context
+    """
+    return HistoryContext.model_construct(
+        similar_issues=_construct_all(HistoricalIssue, data.get("similar_issues", []), "resolved_at"),
+        relevant_code_changes=data.get("relevant_code_changes", {}),
+        deployment_events=tuple(data.get("deployment_events", ())),
+    )
+
 
 class MCPClient:
     """
@@ -13,26 +192,52 @@ class MCPClient:
     This client provides methods for calling MCP tools and accessing MCP resources.
     """
     
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         """
         Initialize the MCP client.
         
         Args:
             base_url: The base URL of the MCP server
+            session: The HTTP session to use. Defaults to the shared session.
         """
         self.base_url = base_url
-        self.session = None
+        self.session = session
+        
+        # Tool URLs keyed by (server name, tool name)
+        self._tool_urls: Dict[Tuple[str, str], str] = {}
     
     async def __aenter__(self):
         """Set up the client session when entering an async context."""
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = await get_session()
+        
         return self
     
+    def _server_url(self, server_name: str, kind: str, name: str) -> str:
+        """
+        Build the URL of a tool or resource on an MCP server.
+        
+        Args:
+            server_name: The name of the MCP server
+            kind: Either "tools" or "resources"
+            name: The name of the tool or URI of the resource
+            
+        Returns:
+            The URL
+        """
+        return f"{self.base_url}/{kind}/{server_name}/{name}"
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close the client session when exiting an async context."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """
+        Exit the async context.
+        
+        The session is shared and outlives individual clients, so it is
+        not closed here.
+        """
     
     async def call_tool(
         self,
@@ -51,21 +256,86 @@ class MCPClient:
         Returns:
             The result of the tool call
         """
+        return orjson.loads(await self._call_tool_raw(server_name, tool_name, arguments))
+    
+    async def _call_tool_raw(
+        self,
+        server_name: str,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> bytes:
+        """
+        Call an MCP tool and return the undecoded response body.
+        
+        Calls are limited per server by an adaptive concurrency limiter,
+        and retried with backoff when the server reports overload.
+        
+        Args:
+            server_name: The name of the MCP server
+            tool_name: The name of the tool to call
+            arguments: The arguments to pass to the tool
+            
+        Returns:
+            The raw JSON result of the tool call
+            
+        Raises:
+            ServiceOverloadError: If the server is still overloaded after
+                all retries
+        """
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = await get_session()
+        
+        url = self._tool_urls.get((server_name, tool_name))
+        if url is None:
+            url = self._tool_urls[(server_name, tool_name)] = self._server_url(
+                server_name, "tools", tool_name
+            )
+        limiter = _get_limiter(server_name)
         
-        url = f"{self.base_url}/tools/{server_name}/{tool_name}"
+        for attempt in range(MAX_OVERLOAD_RETRIES + 1):
+            try:
+                async with limiter:
+                    return await self._request("POST", url, orjson.dumps(arguments))
+            except ServiceOverloadError:
+                if attempt == MAX_OVERLOAD_RETRIES:
+                    raise
+                await asyncio.sleep(OVERLOAD_BACKOFF * 2 ** attempt)
+    
+    async def _request(self, method: str, url: str, data: Optional[bytes] = None) -> bytes:
+        """
+        Send a request to an MCP server and return the raw response body.
+        
+        Args:
+            method: The HTTP method
+            url: The URL to request
+            data: The JSON-encoded request body, if any
+            
+        Returns:
+            The raw JSON response body
+            
+        Raises:
+            ServiceOverloadError: If the server responds with 429, 503 or 504
+        """
+        headers = _JSON_HEADERS if data is not None else None
         
         try:
-            async with self.session.post(url, json=arguments) as response:
+            async with self.session.request(method, url, data=data, headers=headers) as response:
+                if response.status in OVERLOAD_STATUSES:
+                    logger.warning("MCP request to %s rejected with status %s", url, response.status)
+                    raise ServiceOverloadError("MCP server overloaded", response.status)
+                
                 if response.status != 200:
                     error_text = await response.text()
-                    logger.error(f"Error calling MCP tool: {error_text}")
-                    raise Exception(f"Error calling MCP tool: {error_text}")
+                    logger.error("Error from MCP server for %s: %s", url, error_text)
+                    raise Exception(f"Error from MCP server: {error_text}")
                 
-                return await response.json()
-        except Exception as e:
-            logger.exception(f"Exception calling MCP tool: {e}")
+                return await response.read()
+        except aiohttp.ClientError as e:
+            # Only build the traceback when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception("MCP request to %s failed", url)
+            else:
+                logger.error("MCP request to %s failed: %s", url, e)
             raise
     
     async def access_resource(
@@ -84,53 +354,59 @@ class MCPClient:
             The resource data
         """
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = await get_session()
         
-        url = f"{self.base_url}/resources/{server_name}/{uri}"
+        url = self._server_url(server_name, "resources", uri)
         
-        try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Error accessing MCP resource: {error_text}")
-                    raise Exception(f"Error accessing MCP resource: {error_text}")
-                
-                return await response.json()
-        except Exception as e:
-            logger.exception(f"Exception accessing MCP resource: {e}")
-            raise
+        return orjson.loads(await self._request("GET", url))
     
-    async def get_cause_context(self, event_transaction_id: str) -> Dict[str, Any]:
+    async def get_cause_context(self, event_transaction_id: str) -> CauseContext:
         """
         Get cause context information for an issue.
         
+        With SAHUR_VALIDATE_MCP=1 the response is validated straight from
+        JSON. Otherwise it is trusted and built without validation.
+        
         Args:
             event_transaction_id: The transaction ID associated with the issue
             
         Returns:
-            The cause context data
+            The cause context
         """
-        return await self.call_tool(
+        body = await self._call_tool_raw(
             server_name="sahur-mcp",
             tool_name="getCauseContext",
             arguments={"eventTransactionId": event_transaction_id}
         )
+        
+        if VALIDATE_MCP:
+            return CauseContext.model_validate_json(body)
+        
+        return _construct_cause_context(orjson.loads(body))
     
-    async def get_history_context(self, issue_description: str) -> Dict[str, Any]:
+    async def get_history_context(self, issue_description: str) -> HistoryContext:
         """
         Get historical context information for an issue.
         
+        With SAHUR_VALIDATE_MCP=1 the response is validated straight from
+        JSON. Otherwise it is trusted and built without validation.
+        
         Args:
             issue_description: The description of the issue
             
         Returns:
-            The history context data
+            The history context
         """
-        return await self.call_tool(
+        body = await self._call_tool_raw(
             server_name="sahur-mcp",
             tool_name="getHistoryContext",
             arguments={"issueDescription": issue_description}
         )
+        
+        if VALIDATE_MCP:
+            return HistoryContext.model_validate_json(body)
+        
+        return _construct_history_context(orjson.loads(body))
     
     async def get_file_content(self, repo: str, path: str, ref: str = "main") -> str:
         """
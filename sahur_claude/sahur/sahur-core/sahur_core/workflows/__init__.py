@@ -1,11 +1,13 @@
 from sahur_core.workflows.analysis_workflow import (
     create_analysis_workflow,
     run_analysis_workflow,
+    arun_analysis_workflow,
     WorkflowState,
 )
 
 __all__ = [
     "create_analysis_workflow",
     "run_analysis_workflow",
+    "arun_analysis_workflow",
     "WorkflowState",
 ]
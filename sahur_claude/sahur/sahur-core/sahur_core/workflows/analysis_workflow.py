@@ -1,5 +1,8 @@
-from typing import Dict, List, Any, Annotated, TypedDict, Literal
+from typing import Dict, List, Any, Annotated, Optional, TypedDict, Literal
+import asyncio
+import functools
 import json
+import random
 from datetime import datetime
 
 from langgraph.graph import StateGraph, END
@@ -17,17 +20,76 @@ from sahur_core.models import (
     SolutionStep,
 )
 
+# LangChain message class for each conversation role. System messages are
+# sent as human messages.
+_MESSAGE_CLASSES = {
+    "system": HumanMessage,
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
+# Prompts sent after the conversation but not recorded in it
+_ANALYSIS_PROMPT = HumanMessage(
+    content="Based on the context information, analyze this issue and identify the root cause."
+)
+_SOLUTION_PROMPT = HumanMessage(
+    content="Based on your analysis, please generate a detailed solution for this issue."
+)
+
 
 class WorkflowState(TypedDict):
     """State maintained throughout the workflow execution."""
     issue: Issue
     messages: List[Dict[str, Any]]
+    lc_messages: List[Any]
     current_step: str
     cause_context_complete: bool
     history_context_complete: bool
     requires_user_input: bool
     user_input: str
     solution: Solution
+    token_queue: Optional[asyncio.Queue]
+
+
+def _add_message(state: WorkflowState, role: str, content: str) -> None:
+    """
+    Append a message to the conversation in the workflow state.
+    
+    The LangChain representation is kept alongside the plain message so
+    it does not have to be rebuilt before every LLM call.
+    
+    Args:
+        state: The workflow state
+        role: The role of the message sender (system, user, assistant)
+        content: The content of the message
+    """
+    state["messages"].append({"role": role, "content": content})
+    state["lc_messages"].append(_MESSAGE_CLASSES[role](content=content))
+
+
+async def _stream_response(
+    llm: ChatOpenAI, lc_messages: List[Any], token_queue: Optional[asyncio.Queue]
+) -> str:
+    """
+    Stream a response from the LLM.
+    
+    Args:
+        llm: The LLM to call
+        lc_messages: The conversation to send
+        token_queue: Queue that receives each chunk of the response as it
+            arrives, if given
+        
+    Returns:
+        The full response content
+    """
+    chunks = []
+    
+    async for chunk in llm.astream(lc_messages):
+        chunks.append(chunk.content)
+        if token_queue is not None:
+            token_queue.put_nowait(chunk.content)
+    
+    return "".join(chunks)
 
 
 def create_analysis_workflow(model_name: str = "gpt-4o") -> StateGraph:
@@ -46,26 +108,26 @@ def create_analysis_workflow(model_name: str = "gpt-4o") -> StateGraph:
     # Define the workflow graph
     workflow = StateGraph(WorkflowState)
     
-    # Define workflow nodes
+    # Define workflow nodes. Each node returns only the state keys it
+    # updates; LangGraph merges them into the existing state.
     
     # 1. Initialize analysis
-    def initialize_analysis(state: WorkflowState) -> WorkflowState:
+    def initialize_analysis(state: WorkflowState) -> Dict[str, Any]:
         """Initialize the analysis process."""
         issue = state["issue"]
         issue.status = IssueStatus.ANALYZING
         issue.updated_at = datetime.now()
         
+        content = (
+            f"You are analyzing issue {issue.issue_id}: {issue.title}. "
+            f"Description: {issue.description}"
+        )
+        
         return {
-            **state,
             "issue": issue,
             "current_step": "initialize",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": f"You are analyzing issue {issue.issue_id}: {issue.title}. "
-                    f"Description: {issue.description}"
-                }
-            ],
+            "messages": [{"role": "system", "content": content}],
+            "lc_messages": [_MESSAGE_CLASSES["system"](content=content)],
             "cause_context_complete": False,
             "history_context_complete": False,
             "requires_user_input": False,
@@ -74,83 +136,55 @@ def create_analysis_workflow(model_name: str = "gpt-4o") -> StateGraph:
         }
     
     # 2. Gather cause context
-    def gather_cause_context(state: WorkflowState) -> WorkflowState:
+    def gather_cause_context(state: WorkflowState) -> Dict[str, Any]:
         """Gather context information about the cause of the issue."""
         # In a real implementation, this would call external services via MCP
         # For now, we'll just update the state
         issue = state["issue"]
-        messages = state["messages"]
         
-        messages.append({
-            "role": "system",
-            "content": "Gathering cause context information..."
-        })
+        _add_message(state, "system", "Gathering cause context information...")
         
         return {
-            **state,
             "current_step": "gather_cause_context",
-            "messages": messages,
+            "messages": state["messages"],
+            "lc_messages": state["lc_messages"],
             "cause_context_complete": True,
         }
     
     # 3. Gather history context
-    def gather_history_context(state: WorkflowState) -> WorkflowState:
+    def gather_history_context(state: WorkflowState) -> Dict[str, Any]:
         """Gather context information about similar historical issues."""
         # In a real implementation, this would call external services via MCP
         # For now, we'll just update the state
         issue = state["issue"]
-        messages = state["messages"]
         
-        messages.append({
-            "role": "system",
-            "content": "Gathering historical context information..."
-        })
+        _add_message(state, "system", "Gathering historical context information...")
         
         return {
-            **state,
             "current_step": "gather_history_context",
-            "messages": messages,
+            "messages": state["messages"],
+            "lc_messages": state["lc_messages"],
             "history_context_complete": True,
         }
     
     # 4. Analyze issue
-    def analyze_issue(state: WorkflowState) -> WorkflowState:
+    async def analyze_issue(state: WorkflowState) -> Dict[str, Any]:
         """Analyze the issue using the gathered context."""
         issue = state["issue"]
-        messages = state["messages"]
-        
-        # Convert messages to LangChain format
-        lc_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "user":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                lc_messages.append(AIMessage(content=msg["content"]))
-        
-        # Add analysis prompt
-        lc_messages.append(HumanMessage(
-            content="Based on the context information, analyze this issue and identify the root cause."
-        ))
         
         # Get response from LLM
-        response = llm.invoke(lc_messages)
+        response_content = await _stream_response(
+            llm, [*state["lc_messages"], _ANALYSIS_PROMPT], state.get("token_queue")
+        )
         
         # Update messages
-        messages.append({
-            "role": "system",
-            "content": "Analyzing issue..."
-        })
-        messages.append({
-            "role": "assistant",
-            "content": response.content
-        })
+        _add_message(state, "system", "Analyzing issue...")
+        _add_message(state, "assistant", response_content)
         
         return {
-            **state,
             "current_step": "analyze_issue",
-            "messages": messages,
+            "messages": state["messages"],
+            "lc_messages": state["lc_messages"],
         }
     
     # 5. Check if user input is needed
@@ -158,8 +192,7 @@ def create_analysis_workflow(model_name: str = "gpt-4o") -> StateGraph:
         """Check if additional user input is needed to proceed."""
         # For demo purposes, we'll randomly decide if user input is needed
         # In a real implementation, this would be based on the analysis
-        import random
-        needs_input = random.choice([True, False])
+        needs_input = random.getrandbits(1)
         
         if needs_input:
             return "request_user_input"
@@ -167,86 +200,69 @@ def create_analysis_workflow(model_name: str = "gpt-4o") -> StateGraph:
             return "generate_solution"
     
     # 6. Request user input
-    def request_user_input(state: WorkflowState) -> WorkflowState:
+    def request_user_input(state: WorkflowState) -> Dict[str, Any]:
         """Request additional input from the user."""
         issue = state["issue"]
-        messages = state["messages"]
         
         issue.status = IssueStatus.WAITING_FOR_INPUT
         issue.updated_at = datetime.now()
         
-        messages.append({
-            "role": "system",
-            "content": "Additional information is needed to proceed with the analysis."
-        })
-        messages.append({
-            "role": "assistant",
-            "content": "Could you please provide more details about the issue? "
-                      "Specifically, any error messages or logs would be helpful."
-        })
+        _add_message(
+            state,
+            "system",
+            "Additional information is needed to proceed with the analysis."
+        )
+        _add_message(
+            state,
+            "assistant",
+            "Could you please provide more details about the issue? "
+            "Specifically, any error messages or logs would be helpful."
+        )
         
         return {
-            **state,
             "current_step": "request_user_input",
-            "messages": messages,
+            "messages": state["messages"],
+            "lc_messages": state["lc_messages"],
             "requires_user_input": True,
             "issue": issue,
         }
     
     # 7. Process user input
-    def process_user_input(state: WorkflowState) -> WorkflowState:
+    def process_user_input(state: WorkflowState) -> Dict[str, Any]:
         """Process the input provided by the user."""
         issue = state["issue"]
-        messages = state["messages"]
         user_input = state["user_input"]
         
         issue.status = IssueStatus.ANALYZING
         issue.updated_at = datetime.now()
         
-        messages.append({
-            "role": "user",
-            "content": user_input
-        })
+        _add_message(state, "user", user_input)
         
         return {
-            **state,
             "current_step": "process_user_input",
-            "messages": messages,
+            "messages": state["messages"],
+            "lc_messages": state["lc_messages"],
             "requires_user_input": False,
             "issue": issue,
         }
     
     # 8. Generate solution
-    def generate_solution(state: WorkflowState) -> WorkflowState:
+    async def generate_solution(state: WorkflowState) -> Dict[str, Any]:
         """Generate a solution for the issue."""
         issue = state["issue"]
-        messages = state["messages"]
         
         issue.status = IssueStatus.GENERATING_SOLUTION
         issue.updated_at = datetime.now()
         
-        # Convert messages to LangChain format
-        lc_messages = []
-        for msg in messages:
-            if msg["role"] == "system":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "user":
-                lc_messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                lc_messages.append(AIMessage(content=msg["content"]))
-        
-        # Add solution generation prompt
-        lc_messages.append(HumanMessage(
-            content="Based on your analysis, please generate a detailed solution for this issue."
-        ))
-        
         # Get response from LLM
-        response = llm.invoke(lc_messages)
+        response_content = await _stream_response(
+            llm, [*state["lc_messages"], _SOLUTION_PROMPT], state.get("token_queue")
+        )
         
         # Create a solution object
         solution = Solution(
             root_cause="Identified root cause based on analysis",
-            explanation=response.content,
+            explanation=response_content,
             steps=[
                 SolutionStep(
                     step_number=1,
@@ -270,19 +286,13 @@ def create_analysis_workflow(model_name: str = "gpt-4o") -> StateGraph:
         issue.updated_at = datetime.now()
         
         # Update messages
-        messages.append({
-            "role": "system",
-            "content": "Generating solution..."
-        })
-        messages.append({
-            "role": "assistant",
-            "content": response.content
-        })
+        _add_message(state, "system", "Generating solution...")
+        _add_message(state, "assistant", response_content)
         
         return {
-            **state,
             "current_step": "generate_solution",
-            "messages": messages,
+            "messages": state["messages"],
+            "lc_messages": state["lc_messages"],
             "solution": solution,
             "issue": issue,
         }
@@ -314,32 +324,68 @@ def create_analysis_workflow(model_name: str = "gpt-4o") -> StateGraph:
     return workflow
 
 
+@functools.lru_cache(maxsize=4)
+def _get_compiled_workflow(model_name: str = "gpt-4o"):
+    """
+    Get the compiled analysis workflow for a model, building it once.
+    
+    Args:
+        model_name: The name of the LLM model to use
+        
+    Returns:
+        The compiled workflow
+    """
+    return create_analysis_workflow(model_name).compile()
+
+
 def run_analysis_workflow(issue: Issue) -> Issue:
     """
     Run the analysis workflow for an issue.
     
+    This blocks until the workflow finishes, so it must not be called from
+    a running event loop; use arun_analysis_workflow there instead.
+    
+    Args:
+        issue: The issue to analyze
+        
+    Returns:
+        The updated issue with analysis results
+    """
+    return asyncio.run(arun_analysis_workflow(issue))
+
+
+async def arun_analysis_workflow(
+    issue: Issue, token_queue: Optional[asyncio.Queue] = None
+) -> Issue:
+    """
+    Run the analysis workflow for an issue asynchronously.
+    
     Args:
         issue: The issue to analyze
+        token_queue: Queue that receives LLM response chunks as they are
+            streamed, e.g. to forward them to a client
         
     Returns:
         The updated issue with analysis results
     """
-    workflow = create_analysis_workflow()
+    workflow = _get_compiled_workflow()
     
     # Initialize the state
     initial_state = {
         "issue": issue,
         "messages": [],
+        "lc_messages": [],
         "current_step": "",
         "cause_context_complete": False,
         "history_context_complete": False,
         "requires_user_input": False,
         "user_input": "",
         "solution": None,
+        "token_queue": token_queue,
     }
     
     # Run the workflow
-    result = workflow.invoke(initial_state)
+    result = await workflow.ainvoke(initial_state)
     
     # Return the updated issue
     return result["issue"]
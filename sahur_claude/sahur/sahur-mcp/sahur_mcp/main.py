@@ -2,13 +2,16 @@ import os
 import sys
 import logging
 import argparse
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Tuple
 import asyncio
 from dotenv import load_dotenv
 
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import orjson
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
 
 from sahur_mcp.proxy import proxy
 from sahur_mcp.servers import cause_context_server, history_context_server
@@ -29,13 +32,21 @@ app = FastAPI(
     title="SAHUR MCP",
     description="MCP proxy server for SAHUR",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
+# Configure CORS. The MCP API is called by services without cookies, so
+# credentials are not allowed.
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, this should be restricted
-    allow_credentials=True,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -47,9 +58,15 @@ class ToolRequest(BaseModel):
     arguments: Dict[str, Any]
 
 
-class ResourceResponse(BaseModel):
-    """Response model for accessing a resource."""
-    data: Dict[str, Any]
+class ToolCall(BaseModel):
+    """A single tool call in a batch."""
+    name: str
+    arguments: Dict[str, Any]
+
+
+class BatchToolRequest(BaseModel):
+    """Request model for calling several tools at once."""
+    calls: List[ToolCall]
 
 
 class ServerInfo(BaseModel):
@@ -81,6 +98,72 @@ class HealthResponse(BaseModel):
     version: str
 
 
+# Serialized listing responses keyed by (kind, server name), together with
+# the proxy version they were built for
+_listing_cache: Dict[Tuple[str, str], Tuple[int, bytes]] = {}
+
+
+def _cached_listing(
+    kind: str, server_name: str, model: type, build: Callable[[], List[Dict[str, Any]]]
+) -> Response:
+    """
+    Get a listing response, serializing it only when the registry changes.
+    
+    Args:
+        kind: The kind of listing (servers, tools, resources)
+        server_name: The name of the server the listing is for, if any
+        model: The response model each item is validated against
+        build: Function that builds the listing items
+        
+    Returns:
+        The JSON response
+    """
+    key = (kind, server_name)
+    cached = _listing_cache.get(key)
+    
+    if cached is None or cached[0] != proxy.version:
+        content = orjson.dumps([model(**item).model_dump() for item in build()])
+        cached = (proxy.version, content)
+        
+        # Only cache listings for registered servers so unknown names
+        # can't grow the cache
+        if not server_name or server_name in proxy.servers or server_name in proxy.external_servers:
+            _listing_cache[key] = cached
+    
+    return Response(content=cached[1], media_type="application/json")
+
+
+def _register_external_server(name: str, env_prefix: str) -> None:
+    """
+    Register an external server configured through environment variables.
+    
+    The server URL is read from {env_prefix}_URL, and the server is skipped
+    if it is not set. Setting {env_prefix}_COALESCE=true marks the server's
+    calls as idempotent reads, so identical concurrent calls share one
+    request. Setting {env_prefix}_CACHE_TTL to a number of seconds also
+    caches its successful tool and resource responses for that long, and
+    {env_prefix}_BATCH=true forwards batch requests to the server's own
+    /tools/_batch endpoint in one request.
+    
+    Args:
+        name: The name of the external server
+        env_prefix: The prefix of the server's environment variables
+    """
+    url = os.getenv(f"{env_prefix}_URL")
+    if not url:
+        return
+    
+    cache_ttl = os.getenv(f"{env_prefix}_CACHE_TTL")
+    
+    proxy.register_external_server(
+        name,
+        url,
+        cache_ttl=float(cache_ttl) if cache_ttl else None,
+        supports_batch=os.getenv(f"{env_prefix}_BATCH", "false").lower() == "true",
+        coalesce=os.getenv(f"{env_prefix}_COALESCE", "false").lower() == "true",
+    )
+
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -95,17 +178,13 @@ async def startup_event():
     proxy.register_server(history_context_server)
     
     # Register external servers
-    github_url = os.getenv("GITHUB_MCP_URL")
-    if github_url:
-        proxy.register_external_server("github", github_url)
+    _register_external_server("github", "GITHUB_MCP")
+    _register_external_server("slack", "SLACK_MCP")
+    _register_external_server("sentry", "SENTRY_MCP")
     
-    slack_url = os.getenv("SLACK_MCP_URL")
-    if slack_url:
-        proxy.register_external_server("slack", slack_url)
-    
-    sentry_url = os.getenv("SENTRY_MCP_URL")
-    if sentry_url:
-        proxy.register_external_server("sentry", sentry_url)
+    # Create the HTTP sessions used for external servers
+    for name in proxy.external_servers:
+        await proxy.get_session(name)
     
     logger.info("SAHUR MCP started")
 
@@ -129,7 +208,7 @@ async def get_servers():
     Returns:
         A list of server information
     """
-    return proxy.get_servers()
+    return _cached_listing("servers", "", ServerInfo, proxy.get_servers)
 
 
 @app.get("/tools/{server_name}", response_model=List[ToolInfo])
@@ -144,7 +223,9 @@ async def get_tools(server_name: str):
         A list of tool information
     """
     try:
-        return proxy.get_tools(server_name)
+        return _cached_listing(
+            "tools", server_name, ToolInfo, lambda: proxy.get_tools(server_name)
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -161,9 +242,35 @@ async def get_resources(server_name: str):
         A list of resource information
     """
     try:
-        return proxy.get_resources(server_name)
+        return _cached_listing(
+            "resources", server_name, ResourceInfo, lambda: proxy.get_resources(server_name)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+# Registered before the single tool route so that "_batch" isn't taken as a
+# tool name
+@app.post("/tools/{server_name}/_batch")
+async def call_tools_batch(server_name: str, request: BatchToolRequest):
+    """
+    Call several tools on an MCP server in one request.
+    
+    Args:
+        server_name: The name of the server
+        request: The request containing the tool calls
+        
+    Returns:
+        The results of the tool calls, in order
+    """
+    try:
+        calls = [(call.name, call.arguments) for call in request.calls]
+        return ORJSONResponse(await proxy.call_tools_batch(server_name, calls))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.exception(f"Error calling tools: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/tools/{server_name}/{tool_name}")
@@ -180,7 +287,10 @@ async def call_tool(server_name: str, tool_name: str, request: ToolRequest):
         The result of the tool call
     """
     try:
-        return await proxy.call_tool(server_name, tool_name, request.arguments)
+        # Pass the encoded result through as-is, without running it
+        # through FastAPI's encoder
+        body = await proxy.call_tool_raw(server_name, tool_name, request.arguments)
+        return Response(content=body, media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -188,7 +298,7 @@ async def call_tool(server_name: str, tool_name: str, request: ToolRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/resources/{server_name}/{uri:path}", response_model=ResourceResponse)
+@app.get("/resources/{server_name}/{uri:path}", response_model=None)
 async def access_resource(server_name: str, uri: str):
     """
     Access a resource on an MCP server.
@@ -201,8 +311,13 @@ async def access_resource(server_name: str, uri: str):
         The resource data
     """
     try:
-        data = await proxy.access_resource(server_name, uri)
-        return {"data": data}
+        stream, release = await proxy.open_resource_stream(server_name, uri)
+        
+        # Release the upstream connection once the response is done, even
+        # if the client went away before the body was streamed
+        return StreamingResponse(
+            stream, media_type="application/json", background=BackgroundTask(release)
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -245,6 +360,8 @@ def main():
         host=args.host,
         port=args.port,
         reload=args.reload,
+        # Uses uvloop when it is installed, the default event loop otherwise
+        loop="auto",
     )
     
     return 0
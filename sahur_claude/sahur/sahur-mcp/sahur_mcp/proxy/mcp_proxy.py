@@ -1,13 +1,35 @@
 import os
-import json
+import time
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
 import aiohttp
+import orjson
 
 from sahur_core.mcp_server import MCPServer, Tool, Resource, Schema
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks read from external resource responses
+STREAM_CHUNK_SIZE = 65536
+
+# Headers for requests with a pre-encoded JSON body
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Body used in place of an empty successful response, e.g. 204 No Content
+_EMPTY_BODY = b"null"
+
+# Maximum number of cached external responses
+RESPONSE_CACHE_SIZE = 1024
+
+# How often, in seconds, external server tool and resource listings are
+# refreshed
+EXTERNAL_REFRESH_INTERVAL = 60
+
+# Name of the tool endpoint that runs several tool calls in one request
+BATCH_TOOL_NAME = "_batch"
+
 
 class MCPProxy:
     """
@@ -16,11 +38,65 @@ class MCPProxy:
     This class is responsible for routing requests to the appropriate MCP server.
     """
     
+    __slots__ = (
+        "servers",
+        "external_servers",
+        "_external_tool_base",
+        "_external_resource_base",
+        "_sessions",
+        "_inflight",
+        "_coalesce_servers",
+        "_cache_ttls",
+        "_response_cache",
+        "_server_list_cache",
+        "_external_tools",
+        "_external_resources",
+        "_refresh_tasks",
+        "_batch_servers",
+        "version",
+    )
+    
     def __init__(self):
         """Initialize the MCP proxy."""
         self.servers: Dict[str, MCPServer] = {}
         self.external_servers: Dict[str, str] = {}
-        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # Base URLs for external tool and resource requests, built when
+        # servers are registered
+        self._external_tool_base: Dict[str, str] = {}
+        self._external_resource_base: Dict[str, str] = {}
+        
+        # One HTTP session per external server, so each server gets its
+        # own connection pool and busy servers can't starve the others
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        
+        # External servers whose calls are idempotent reads, and their calls
+        # currently in flight, so identical concurrent calls share one request
+        self._coalesce_servers: Set[str] = set()
+        self._inflight: Dict[Tuple[str, ...], asyncio.Task] = {}
+        
+        # Response cache TTLs for the external servers that opted in, and
+        # the cached response bodies as (expiry, body), least recently used
+        # first
+        self._cache_ttls: Dict[str, float] = {}
+        self._response_cache: "OrderedDict[Tuple[str, ...], Tuple[float, bytes]]" = OrderedDict()
+        
+        # Server listing, built on first use after a registration rather
+        # than on every request
+        self._server_list_cache: Optional[List[Dict[str, Any]]] = None
+        
+        # Tool and resource listings prefetched from external servers, and
+        # the background tasks that refresh them
+        self._external_tools: Dict[str, List[Dict[str, Any]]] = {}
+        self._external_resources: Dict[str, List[Dict[str, Any]]] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        
+        # External servers that accept batched tool calls
+        self._batch_servers: Set[str] = set()
+        
+        # Incremented whenever a server is registered, so cached listings
+        # can tell when they are stale
+        self.version = 0
     
     def register_server(self, server: MCPServer) -> None:
         """
@@ -30,114 +106,263 @@ class MCPProxy:
             server: The MCP server to register
         """
         self.servers[server.name] = server
-        logger.info(f"Registered MCP server: {server.name}")
+        self._server_list_cache = None
+        self.version += 1
+        logger.info("Registered MCP server: %s", server.name)
     
-    def register_external_server(self, name: str, url: str) -> None:
+    def register_external_server(
+        self,
+        name: str,
+        url: str,
+        cache_ttl: Optional[float] = None,
+        supports_batch: bool = False,
+        coalesce: bool = False,
+    ) -> None:
         """
         Register an external MCP server.
         
+        If called with an event loop running, the server's tool and resource
+        listings are prefetched and then refreshed in the background.
+        
         Args:
             name: The name of the external server
             url: The URL of the external server
+            cache_ttl: How long, in seconds, to cache successful tool and
+                resource responses. Only set this for servers whose calls
+                are idempotent. Responses are not cached by default.
+            supports_batch: Whether the server accepts several tool calls
+                in one request at /tools/_batch
+            coalesce: Whether identical concurrent calls may share one
+                request. Only set this for servers whose calls are
+                idempotent; servers with a cache_ttl are always coalesced.
         """
         self.external_servers[name] = url
-        logger.info(f"Registered external MCP server: {name} at {url}")
+        self._external_tool_base[name] = url.rstrip("/") + "/tools/"
+        self._external_resource_base[name] = url.rstrip("/") + "/resources/"
+        self._server_list_cache = None
+        
+        if cache_ttl:
+            self._cache_ttls[name] = cache_ttl
+        else:
+            self._cache_ttls.pop(name, None)
+        
+        if coalesce or cache_ttl:
+            self._coalesce_servers.add(name)
+        else:
+            self._coalesce_servers.discard(name)
+        
+        if supports_batch:
+            self._batch_servers.add(name)
+        else:
+            self._batch_servers.discard(name)
+        
+        # Drop responses cached for a previous registration
+        for key in [key for key in self._response_cache if key[0] == name]:
+            del self._response_cache[key]
+        
+        self._external_tools.pop(name, None)
+        self._external_resources.pop(name, None)
+        self._start_refresh(name)
+        
+        self.version += 1
+        logger.info("Registered external MCP server: %s at %s", name, url)
+    
+    def _start_refresh(self, name: str) -> None:
+        """
+        Start refreshing an external server's listings in the background.
+        
+        Any refresh already running for the server is cancelled.
+        
+        Args:
+            name: The name of the external server
+        """
+        task = self._refresh_tasks.pop(name, None)
+        if task is not None:
+            task.cancel()
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        self._refresh_tasks[name] = loop.create_task(self._refresh_external(name))
+    
+    async def _refresh_external(self, name: str) -> None:
+        """
+        Fetch an external server's tool and resource listings periodically.
+        
+        Failures are logged and the previous listings are kept.
+        
+        Args:
+            name: The name of the external server
+        """
+        while True:
+            try:
+                tools, resources = await asyncio.gather(
+                    self._fetch_listing(name, "tools"),
+                    self._fetch_listing(name, "resources"),
+                )
+                
+                if (
+                    tools != self._external_tools.get(name)
+                    or resources != self._external_resources.get(name)
+                ):
+                    self._external_tools[name] = tools
+                    self._external_resources[name] = resources
+                    self.version += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Error refreshing listings for external MCP server %s: %s", name, e)
+            
+            await asyncio.sleep(EXTERNAL_REFRESH_INTERVAL)
+    
+    async def _fetch_listing(self, name: str, kind: str) -> List[Dict[str, Any]]:
+        """
+        Fetch a listing from an external server.
+        
+        Args:
+            name: The name of the external server
+            kind: The kind of listing (tools, resources)
+            
+        Returns:
+            The listing
+        """
+        url = f"{self.external_servers[name].rstrip('/')}/{kind}"
+        
+        session = await self.get_session(name)
+        
+        try:
+            async with session.get(url) as response:
+                listing = orjson.loads(await response.read() or _EMPTY_BODY)
+        except aiohttp.ClientResponseError as e:
+            raise ValueError(f"Error listing external {kind}: {e.status} {e.message}") from e
+        
+        if not isinstance(listing, list):
+            raise ValueError(f"Invalid external {kind} listing")
+        
+        return listing
     
-    async def get_session(self) -> aiohttp.ClientSession:
+    async def get_session(self, server_name: str) -> aiohttp.ClientSession:
         """
-        Get the HTTP session.
+        Get the HTTP session for an external server, creating it if necessary.
+        
+        Sessions are shared by all requests to the same server, so its
+        connections are kept alive and reused. They raise
+        aiohttp.ClientResponseError for non-2xx responses. No lock is needed: there is
+        no await between the check and the assignment, so concurrent
+        callers can't both create a session.
         
+        Args:
+            server_name: The name of the external server
+            
         Returns:
             The HTTP session
         """
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+        session = self._sessions.get(server_name)
+        
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                raise_for_status=True,
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=64,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+            self._sessions[server_name] = session
         
-        return self.session
+        return session
     
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """Stop refreshing external listings and close the HTTP sessions."""
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks.clear()
+        
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        
+        for session in sessions:
+            if not session.closed:
+                await session.close()
     
     def get_servers(self) -> List[Dict[str, Any]]:
         """
         Get a list of available servers.
         
+        The list is built once per registration change; callers must not
+        modify it.
+        
         Returns:
             A list of server information
         """
-        servers = []
-        
-        # Add local servers
-        for name, server in self.servers.items():
-            servers.append({
-                "name": name,
-                "type": "local",
-                "description": server.__class__.__doc__ or "",
-            })
-        
-        # Add external servers
-        for name, url in self.external_servers.items():
-            servers.append({
-                "name": name,
-                "type": "external",
-                "url": url,
-            })
+        if self._server_list_cache is None:
+            servers = []
+            
+            # Add local servers
+            for name, server in self.servers.items():
+                servers.append({
+                    "name": name,
+                    "type": "local",
+                    "description": server.__class__.__doc__ or "",
+                })
+            
+            # Add external servers
+            for name, url in self.external_servers.items():
+                servers.append({
+                    "name": name,
+                    "type": "external",
+                    "url": url,
+                })
+            
+            self._server_list_cache = servers
         
-        return servers
+        return self._server_list_cache
     
     def get_tools(self, server_name: str) -> List[Dict[str, Any]]:
         """
         Get a list of available tools for a server.
         
+        Local servers maintain the list as tools are added, and external
+        server lists are refreshed in the background; callers must not
+        modify it.
+        
         Args:
             server_name: The name of the server
             
         Returns:
             A list of tool information
         """
-        if server_name in self.servers:
-            server = self.servers[server_name]
-            return [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.input_schema.schema,
-                    "output_schema": tool.output_schema.schema,
-                }
-                for tool in server.tools.values()
-            ]
+        server = self.servers.get(server_name)
+        if server is not None:
+            return server.tool_descriptors
         
-        # For external servers, we would need to fetch this information
-        # For now, return an empty list
-        return []
+        # External server listings are prefetched in the background
+        return self._external_tools.get(server_name, [])
     
     def get_resources(self, server_name: str) -> List[Dict[str, Any]]:
         """
         Get a list of available resources for a server.
         
+        Local servers maintain the list as resources are added, and
+        external server lists are refreshed in the background; callers
+        must not modify it.
+        
         Args:
             server_name: The name of the server
             
         Returns:
             A list of resource information
         """
-        if server_name in self.servers:
-            server = self.servers[server_name]
-            return [
-                {
-                    "uri": resource.uri,
-                    "description": resource.description,
-                    "schema": resource.schema.schema,
-                }
-                for resource in server.resources.values()
-            ]
+        server = self.servers.get(server_name)
+        if server is not None:
+            return server.resource_descriptors
         
-        # For external servers, we would need to fetch this information
-        # For now, return an empty list
-        return []
+        # External server listings are prefetched in the background
+        return self._external_resources.get(server_name, [])
     
     async def call_tool(
         self, server_name: str, tool_name: str, arguments: Dict[str, Any]
@@ -154,30 +379,159 @@ class MCPProxy:
             The result of the tool call
         """
         # Check if this is a local server
-        if server_name in self.servers:
-            server = self.servers[server_name]
-            
-            if tool_name in server.tools:
-                tool = server.tools[tool_name]
-                return await tool.handler(arguments)
-            else:
-                raise ValueError(f"Tool not found: {tool_name}")
+        server = self.servers.get(server_name)
+        if server is not None:
+            return await server.call_tool(tool_name, arguments)
         
         # Check if this is an external server
         if server_name in self.external_servers:
-            url = f"{self.external_servers[server_name]}/tools/{tool_name}"
+            return orjson.loads(await self._external_tool_body(server_name, tool_name, arguments))
+        
+        raise ValueError(f"Server not found: {server_name}")
+    
+    async def call_tool_raw(
+        self, server_name: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> bytes:
+        """
+        Call a tool on an MCP server and get the result encoded as JSON.
+        
+        Local tools with a raw handler and external tools return encoded
+        results, which are passed through without being decoded or
+        re-encoded.
+        
+        Args:
+            server_name: The name of the server
+            tool_name: The name of the tool
+            arguments: The arguments for the tool
+            
+        Returns:
+            The result of the tool call as JSON bytes
+        """
+        server = self.servers.get(server_name)
+        if server is not None:
+            return await server.call_tool_raw(tool_name, arguments)
+        
+        if server_name in self.external_servers:
+            return await self._external_tool_body(server_name, tool_name, arguments)
+        
+        raise ValueError(f"Server not found: {server_name}")
+    
+    async def call_tools_batch(
+        self, server_name: str, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """
+        Call several tools on an MCP server.
+        
+        Local tools run concurrently. External servers that support batching
+        get all the calls in a single request; for other external servers
+        the calls are made concurrently, one request each. If any call
+        fails, the whole batch fails.
+        
+        Args:
+            server_name: The name of the server
+            calls: The tool calls, as (tool name, arguments) pairs
             
-            session = await self.get_session()
+        Returns:
+            The results of the tool calls, in order
+        """
+        server = self.servers.get(server_name)
+        if server is not None:
+            return await server.call_tools(calls)
+        
+        if server_name in self.external_servers:
+            if server_name in self._batch_servers and len(calls) > 1:
+                return await self._call_external_batch(server_name, calls)
             
-            async with session.post(url, json=arguments) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise ValueError(f"Error calling external tool: {error_text}")
-                
-                return await response.json()
+            return list(await asyncio.gather(*(
+                self.call_tool(server_name, tool_name, arguments)
+                for tool_name, arguments in calls
+            )))
         
         raise ValueError(f"Server not found: {server_name}")
     
+    async def _call_external_batch(
+        self, server_name: str, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """
+        Call several tools on an external MCP server in one request.
+        
+        Batched calls bypass the response cache.
+        
+        Args:
+            server_name: The name of the external server
+            calls: The tool calls, as (tool name, arguments) pairs
+            
+        Returns:
+            The results of the tool calls, in order
+        """
+        url = self._external_tool_base[server_name] + BATCH_TOOL_NAME
+        body = orjson.dumps({
+            "calls": [
+                {"name": tool_name, "arguments": arguments}
+                for tool_name, arguments in calls
+            ]
+        })
+        
+        session = await self.get_session(server_name)
+        
+        try:
+            async with session.post(url, data=body, headers=_JSON_HEADERS) as response:
+                results = orjson.loads(await response.read() or _EMPTY_BODY)
+        except aiohttp.ClientResponseError as e:
+            raise ValueError(f"Error calling external tools: {e.status} {e.message}") from e
+        
+        if not isinstance(results, list) or len(results) != len(calls):
+            raise ValueError("Invalid external batch response")
+        
+        return results
+    
+    async def _external_tool_body(
+        self, server_name: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> bytes:
+        """
+        Call a tool on an external MCP server through the cache.
+        
+        Args:
+            server_name: The name of the external server
+            tool_name: The name of the tool
+            arguments: The arguments for the tool
+            
+        Returns:
+            The response body
+        """
+        key = (
+            server_name,
+            tool_name,
+            orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS).decode(),
+        )
+        return await self._cached_call(
+            key, lambda: self._post_external_tool(server_name, tool_name, arguments)
+        )
+    
+    async def _post_external_tool(
+        self, server_name: str, tool_name: str, arguments: Dict[str, Any]
+    ) -> bytes:
+        """
+        Send a single tool call to an external MCP server.
+        
+        Args:
+            server_name: The name of the external server
+            tool_name: The name of the tool
+            arguments: The arguments for the tool
+            
+        Returns:
+            The response body
+        """
+        url = self._external_tool_base[server_name] + tool_name
+        
+        session = await self.get_session(server_name)
+        
+        try:
+            async with session.post(url, data=orjson.dumps(arguments), headers=_JSON_HEADERS) as response:
+                return await response.read() or _EMPTY_BODY
+        except aiohttp.ClientResponseError as e:
+            raise ValueError(f"Error calling external tool: {e.status} {e.message}") from e
+    
     async def access_resource(self, server_name: str, uri: str) -> Dict[str, Any]:
         """
         Access a resource on an MCP server.
@@ -190,30 +544,189 @@ class MCPProxy:
             The resource data
         """
         # Check if this is a local server
-        if server_name in self.servers:
-            server = self.servers[server_name]
+        server = self.servers.get(server_name)
+        if server is not None:
+            return await server.access_resource(uri)
+        
+        # Check if this is an external server
+        if server_name in self.external_servers:
+            body = await self._cached_call(
+                (server_name, uri), lambda: self._access_external_resource(server_name, uri)
+            )
+            return orjson.loads(body)
+        
+        raise ValueError(f"Server not found: {server_name}")
+    
+    async def _access_external_resource(self, server_name: str, uri: str) -> bytes:
+        """
+        Access a resource on an external MCP server.
+        
+        Args:
+            server_name: The name of the external server
+            uri: The URI of the resource
             
-            if uri in server.resources:
-                resource = server.resources[uri]
-                return await resource.handler()
-            else:
-                raise ValueError(f"Resource not found: {uri}")
+        Returns:
+            The response body
+        """
+        url = self._external_resource_base[server_name] + uri
+        
+        session = await self.get_session(server_name)
+        
+        try:
+            async with session.get(url) as response:
+                return await response.read() or _EMPTY_BODY
+        except aiohttp.ClientResponseError as e:
+            raise ValueError(f"Error accessing external resource: {e.status} {e.message}") from e
+    
+    async def _cached_call(
+        self, key: Tuple[str, ...], call: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Run an external call, using the response cache if the server has one.
+        
+        Only successful responses are cached; errors are raised as usual.
+        Calls to servers that did not opt in to coalescing, which may have
+        side effects, are always made on their own.
+        
+        Args:
+            key: The key identifying the call. Its first item is the server name.
+            call: Function that starts the call
+            
+        Returns:
+            The response body
+        """
+        if key[0] not in self._coalesce_servers:
+            return await call()
+        
+        ttl = self._cache_ttls.get(key[0])
+        if ttl is None:
+            return await self._coalesce(key, call)
+        
+        entry = self._response_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._response_cache.move_to_end(key)
+            return entry[1]
+        
+        result = await self._coalesce(key, call)
+        
+        self._response_cache[key] = (time.monotonic() + ttl, result)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        
+        return result
+    
+    async def _coalesce(
+        self, key: Tuple[str, ...], call: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Run an external call, sharing it with identical calls in flight.
+        
+        The first caller for a key starts the call; callers that arrive
+        before it finishes await the same task and get the same result, or
+        the same error. The task is shielded so that one caller being
+        cancelled doesn't cancel it for the others.
+        
+        Args:
+            key: The key identifying the call
+            call: Function that starts the call
+            
+        Returns:
+            The response body
+        """
+        task = self._inflight.get(key)
+        
+        if task is None:
+            task = asyncio.create_task(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        return await asyncio.shield(task)
+    
+    async def open_resource_stream(
+        self, server_name: str, uri: str
+    ) -> Tuple[AsyncIterator[bytes], Callable[[], None]]:
+        """
+        Access a resource on an MCP server as a stream of JSON bytes.
+        
+        The stream holds the resource wrapped as {"data": ...}. For
+        external servers, the response body is forwarded in chunks as it
+        arrives instead of being decoded and re-encoded; servers with a
+        response cache are read in full through the cache instead. Errors
+        are raised here, before any bytes are streamed.
+        
+        Args:
+            server_name: The name of the server
+            uri: The URI of the resource
+            
+        Returns:
+            An async iterator over the response body, and a function that
+            releases the connection behind it. The caller must call it once
+            the response is done, even if the stream was never iterated;
+            calling it more than once is harmless.
+        """
+        # Check if this is a local server
+        server = self.servers.get(server_name)
+        if server is not None:
+            data = await server.access_resource(uri)
+            return _single_chunk(orjson.dumps({"data": data})), _release_nothing
         
         # Check if this is an external server
         if server_name in self.external_servers:
-            url = f"{self.external_servers[server_name]}/resources/{uri}"
+            if server_name in self._cache_ttls:
+                body = await self._cached_call(
+                    (server_name, uri), lambda: self._access_external_resource(server_name, uri)
+                )
+                return _single_chunk(b'{"data":' + body + b"}"), _release_nothing
             
-            session = await self.get_session()
+            url = self._external_resource_base[server_name] + uri
             
-            async with session.get(url) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise ValueError(f"Error accessing external resource: {error_text}")
-                
-                return await response.json()
+            session = await self.get_session(server_name)
+            
+            try:
+                response = await session.get(url)
+            except aiohttp.ClientResponseError as e:
+                raise ValueError(f"Error accessing external resource: {e.status} {e.message}") from e
+            
+            return _wrap_data_stream(response), response.release
         
         raise ValueError(f"Server not found: {server_name}")
 
 
+def _release_nothing() -> None:
+    """Release function for streams that hold no connection."""
+
+
+async def _single_chunk(body: bytes) -> AsyncIterator[bytes]:
+    """
+    Yield a body as a single chunk.
+    
+    Args:
+        body: The body to yield
+    """
+    yield body
+
+
+async def _wrap_data_stream(response: aiohttp.ClientResponse) -> AsyncIterator[bytes]:
+    """
+    Stream a JSON response body wrapped as {"data": ...}.
+    
+    Args:
+        response: The response to stream. It is released as soon as the
+            body has been streamed; the caller releases it otherwise.
+    """
+    try:
+        yield b'{"data":'
+        empty = True
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            empty = False
+            yield chunk
+        if empty:
+            yield _EMPTY_BODY
+        yield b"}"
+    finally:
+        response.release()
+
+
 # Create a global instance of the proxy
 proxy = MCPProxy()
@@ -1,15 +1,326 @@
 import os
 import json
+import time
+import functools
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
 from datetime import datetime
 
+import orjson
+
 from sahur_core.mcp_server import MCPServer, Tool, Resource, Schema
 
 logger = logging.getLogger(__name__)
 
 
+# Dummy cause contexts, built once. Event timestamps are left as None and
+# filled in by _stamp() on each call.
+_JAVA_CAUSE_CONTEXT = {
+    "stack_trace": {
+        "exception_type": "java.lang.NullPointerException",
+        "exception_message": "Cannot invoke method getUser() on null object",
+        "frames": [
+            {
+                "file_path": "com/example/service/UserService.java",
+                "line_number": 42,
+                "method_name": "processUserRequest",
+                "code_line": "return userRequest.getUser().getId();"
+            },
+            {
+                "file_path": "com/example/controller/UserController.java",
+                "line_number": 28,
+                "method_name": "handleRequest",
+                "code_line": "UserDTO user = userService.processUserRequest(request);"
+            },
+            {
+                "file_path": "com/example/api/ApiHandler.java",
+                "line_number": 15,
+                "method_name": "handleApiRequest",
+                "code_line": "return userController.handleRequest(request);"
+            }
+        ]
+    },
+    "http_requests": [
+        {
+            "method": "POST",
+            "url": "https://api.example.com/users",
+            "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
+            "body": {"action": "getUser", "params": {}},
+            "timestamp": None
+        }
+    ],
+    "http_responses": [
+        {
+            "status_code": 500,
+            "headers": {"Content-Type": "application/json"},
+            "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
+            "timestamp": None
+        }
+    ],
+    "logs": [
+        "2025-05-22T15:20:30.123Z ERROR [UserService] - Exception while processing user request",
+        "2025-05-22T15:20:30.124Z ERROR [UserService] - java.lang.NullPointerException: Cannot invoke method getUser() on null object",
+        "2025-05-22T15:20:30.125Z ERROR [UserService] - at com.example.service.UserService.processUserRequest(UserService.java:42)",
+        "2025-05-22T15:20:30.126Z ERROR [UserService] - at com.example.controller.UserController.handleRequest(UserController.java:28)",
+        "2025-05-22T15:20:30.127Z ERROR [UserService] - at com.example.api.ApiHandler.handleApiRequest(ApiHandler.java:15)"
+    ]
+}
+
+_PYTHON_CAUSE_CONTEXT = {
+    "stack_trace": {
+        "exception_type": "AttributeError",
+        "exception_message": "'NoneType' object has no attribute 'get_user'",
+        "frames": [
+            {
+                "file_path": "app/services/user_service.py",
+                "line_number": 25,
+                "method_name": "process_user_request",
+                "code_line": "return user_request.get_user().id"
+            },
+            {
+                "file_path": "app/controllers/user_controller.py",
+                "line_number": 18,
+                "method_name": "handle_request",
+                "code_line": "user = user_service.process_user_request(request)"
+            },
+            {
+                "file_path": "app/api/api_handler.py",
+                "line_number": 10,
+                "method_name": "handle_api_request",
+                "code_line": "return user_controller.handle_request(request)"
+            }
+        ]
+    },
+    "http_requests": [
+        {
+            "method": "POST",
+            "url": "https://api.example.com/users",
+            "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
+            "body": {"action": "get_user", "params": {}},
+            "timestamp": None
+        }
+    ],
+    "http_responses": [
+        {
+            "status_code": 500,
+            "headers": {"Content-Type": "application/json"},
+            "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
+            "timestamp": None
+        }
+    ],
+    "logs": [
+        "2025-05-22 15:20:30,123 - ERROR - [user_service] - Exception while processing user request",
+        "2025-05-22 15:20:30,124 - ERROR - [user_service] - AttributeError: 'NoneType' object has no attribute 'get_user'",
+        "2025-05-22 15:20:30,125 - ERROR - [user_service] - File \"app/services/user_service.py\", line 25, in process_user_request",
+        "2025-05-22 15:20:30,126 - ERROR - [user_service] - return user_request.get_user().id",
+        "2025-05-22 15:20:30,127 - ERROR - [user_service] - File \"app/controllers/user_controller.py\", line 18, in handle_request",
+        "2025-05-22 15:20:30,128 - ERROR - [user_service] - user = user_service.process_user_request(request)",
+        "2025-05-22 15:20:30,129 - ERROR - [user_service] - File \"app/api/api_handler.py\", line 10, in handle_api_request",
+        "2025-05-22 15:20:30,130 - ERROR - [user_service] - return user_controller.handle_request(request)"
+    ]
+}
+
+_NODE_CAUSE_CONTEXT = {
+    "stack_trace": {
+        "exception_type": "TypeError",
+        "exception_message": "Cannot read property 'getUser' of null",
+        "frames": [
+            {
+                "file_path": "src/services/userService.js",
+                "line_number": 15,
+                "method_name": "processUserRequest",
+                "code_line": "return userRequest.getUser().getId();"
+            },
+            {
+                "file_path": "src/controllers/userController.js",
+                "line_number": 10,
+                "method_name": "handleRequest",
+                "code_line": "const user = userService.processUserRequest(request);"
+            },
+            {
+                "file_path": "src/api/apiHandler.js",
+                "line_number": 8,
+                "method_name": "handleApiRequest",
+                "code_line": "return userController.handleRequest(request);"
+            }
+        ]
+    },
+    "http_requests": [
+        {
+            "method": "POST",
+            "url": "https://api.example.com/users",
+            "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
+            "body": {"action": "getUser", "params": {}},
+            "timestamp": None
+        }
+    ],
+    "http_responses": [
+        {
+            "status_code": 500,
+            "headers": {"Content-Type": "application/json"},
+            "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
+            "timestamp": None
+        }
+    ],
+    "logs": [
+        "2025-05-22T15:20:30.123Z ERROR [userService] - Exception while processing user request",
+        "2025-05-22T15:20:30.124Z ERROR [userService] - TypeError: Cannot read property 'getUser' of null",
+        "2025-05-22T15:20:30.125Z ERROR [userService] - at processUserRequest (/app/src/services/userService.js:15:28)",
+        "2025-05-22T15:20:30.126Z ERROR [userService] - at handleRequest (/app/src/controllers/userController.js:10:22)",
+        "2025-05-22T15:20:30.127Z ERROR [userService] - at handleApiRequest (/app/src/api/apiHandler.js:8:16)"
+    ]
+}
+
+_GENERIC_CAUSE_CONTEXT = {
+    "http_requests": [
+        {
+            "method": "POST",
+            "url": "https://api.example.com/data",
+            "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
+            "body": {"action": "getData", "params": {"id": "123"}},
+            "timestamp": None
+        }
+    ],
+    "http_responses": [
+        {
+            "status_code": 500,
+            "headers": {"Content-Type": "application/json"},
+            "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
+            "timestamp": None
+        }
+    ],
+    "logs": [
+        "2025-05-22T15:20:30.123Z ERROR [DataService] - Failed to process request",
+        "2025-05-22T15:20:30.124Z ERROR [DataService] - Error details: Connection timeout",
+        "2025-05-22T15:20:30.125Z ERROR [DataService] - Request ID: REQ-123456"
+    ],
+    "kafka_messages": [
+        {
+            "topic": "data-events",
+            "partition": 0,
+            "offset": 12345,
+            "key": "user-123",
+            "value": {"event": "data-request", "userId": "123", "timestamp": "2025-05-22T15:20:25Z"},
+            "timestamp": None,
+            "headers": {"source": "web-api", "version": "1.0"}
+        }
+    ],
+    "database_errors": [
+        {
+            "error_code": "ER_LOCK_WAIT_TIMEOUT",
+            "error_message": "Lock wait timeout exceeded; try restarting transaction",
+            "query": "SELECT * FROM users WHERE id = ?",
+            "parameters": {"id": "123"},
+            "timestamp": None
+        }
+    ]
+}
+
+# Templates by the transaction ID prefix they are used for (see
+# _transaction_prefix), and the same templates encoded as JSON for the raw
+# handler
+_CAUSE_CONTEXT_TEMPLATES = {
+    "java": _JAVA_CAUSE_CONTEXT,
+    "python": _PYTHON_CAUSE_CONTEXT,
+    "node": _NODE_CAUSE_CONTEXT,
+}
+_CAUSE_CONTEXT_JSON = {
+    prefix: orjson.dumps(template) for prefix, template in _CAUSE_CONTEXT_TEMPLATES.items()
+}
+_GENERIC_CAUSE_CONTEXT_JSON = orjson.dumps(_GENERIC_CAUSE_CONTEXT)
+
+# How an unset event timestamp appears in the encoded templates
+_NULL_TIMESTAMP = b'"timestamp":null'
+
+
+def _transaction_prefix(event_transaction_id: str) -> str:
+    """
+    Get the prefix of a transaction ID, used to pick its dummy context.
+    
+    The prefix is everything before the first "-" or ":", e.g. "java" for
+    "java-1234".
+    
+    Args:
+        event_transaction_id: The transaction ID
+        
+    Returns:
+        The prefix
+    """
+    return event_transaction_id.split("-", 1)[0].split(":", 1)[0]
+
+
+# How long, in seconds, a formatted event timestamp is reused
+TIMESTAMP_RESOLUTION = 0.05
+
+# The last formatted event timestamp, as (monotonic time it was taken,
+# ISO string, encoded "timestamp" member for the raw handler)
+_cached_timestamp: Tuple[float, str, bytes] = (float("-inf"), "", b"")
+
+
+def _current_timestamp() -> Tuple[str, bytes]:
+    """
+    Get the current event timestamp, formatted at most once per resolution.
+    
+    Returns:
+        The ISO timestamp and its encoded "timestamp" JSON member
+    """
+    global _cached_timestamp
+    
+    now = time.monotonic()
+    if now - _cached_timestamp[0] > TIMESTAMP_RESOLUTION:
+        timestamp = datetime.now().isoformat()
+        _cached_timestamp = (now, timestamp, b'"timestamp":' + orjson.dumps(timestamp))
+    
+    return _cached_timestamp[1], _cached_timestamp[2]
+
+
+# Cause context fields holding lists of timestamped events
+_EVENT_FIELDS = ("http_requests", "http_responses", "kafka_messages", "database_errors")
+
+
+def _stamp(template: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+    """
+    Copy a cause context template, setting the timestamp of each event.
+    
+    Only the event lists and events are copied; everything else is shared
+    with the template, so callers must not modify the result.
+    
+    Args:
+        template: The cause context template
+        timestamp: The timestamp to set
+        
+    Returns:
+        The cause context
+    """
+    context = dict(template)
+    
+    for field in _EVENT_FIELDS:
+        if field in template:
+            context[field] = [{**event, "timestamp": timestamp} for event in template[field]]
+    
+    return context
+
+
+@functools.lru_cache(maxsize=8)
+def _stamped_context(prefix: str, timestamp: str) -> Dict[str, Any]:
+    """
+    Get the dummy cause context for a prefix, stamped with a timestamp.
+    
+    Timestamps are reused for TIMESTAMP_RESOLUTION, so calls within that
+    window share one stamped context instead of copying the template.
+    
+    Args:
+        prefix: A key of _CAUSE_CONTEXT_TEMPLATES, or "" for the generic
+            context
+        timestamp: The timestamp to set
+        
+    Returns:
+        The cause context, which callers must not modify
+    """
+    return _stamp(_CAUSE_CONTEXT_TEMPLATES.get(prefix, _GENERIC_CAUSE_CONTEXT), timestamp)
+
+
 class CauseContextServer(MCPServer):
     """
     MCP server for cause context information.
@@ -41,7 +352,8 @@ class CauseContextServer(MCPServer):
                     "type": "object",
                     "description": "Cause context information"
                 }),
-                handler=self.get_cause_context
+                handler=self.get_cause_context,
+                raw_handler=self.get_cause_context_raw,
             )
         )
     
@@ -57,249 +369,38 @@ class CauseContextServer(MCPServer):
         """
         event_transaction_id = arguments.get("eventTransactionId")
         
-        logger.info(f"Getting cause context for transaction ID: {event_transaction_id}")
+        logger.info("Getting cause context for transaction ID: %s", event_transaction_id)
         
         # In a real implementation, this would retrieve actual data
-        # For now, we'll return dummy data
+        # For now, we'll return dummy data based on the transaction ID
+        prefix = _transaction_prefix(event_transaction_id)
+        if prefix not in _CAUSE_CONTEXT_TEMPLATES:
+            prefix = ""
         
-        # Generate a stack trace based on the transaction ID
-        if event_transaction_id.startswith("java"):
-            return self._get_java_stack_trace()
-        elif event_transaction_id.startswith("python"):
-            return self._get_python_stack_trace()
-        elif event_transaction_id.startswith("node"):
-            return self._get_node_stack_trace()
-        else:
-            return self._get_generic_cause_context()
+        return _stamped_context(prefix, _current_timestamp()[0])
     
-    def _get_java_stack_trace(self) -> Dict[str, Any]:
+    async def get_cause_context_raw(self, arguments: Dict[str, Any]) -> bytes:
         """
-        Get a dummy Java stack trace.
+        Get cause context for an event transaction, encoded as JSON.
         
-        Returns:
-            A dummy cause context with a Java stack trace
-        """
-        return {
-            "stack_trace": {
-                "exception_type": "java.lang.NullPointerException",
-                "exception_message": "Cannot invoke method getUser() on null object",
-                "frames": [
-                    {
-                        "file_path": "com/example/service/UserService.java",
-                        "line_number": 42,
-                        "method_name": "processUserRequest",
-                        "code_line": "return userRequest.getUser().getId();"
-                    },
-                    {
-                        "file_path": "com/example/controller/UserController.java",
-                        "line_number": 28,
-                        "method_name": "handleRequest",
-                        "code_line": "UserDTO user = userService.processUserRequest(request);"
-                    },
-                    {
-                        "file_path": "com/example/api/ApiHandler.java",
-                        "line_number": 15,
-                        "method_name": "handleApiRequest",
-                        "code_line": "return userController.handleRequest(request);"
-                    }
-                ]
-            },
-            "http_requests": [
-                {
-                    "method": "POST",
-                    "url": "https://api.example.com/users",
-                    "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
-                    "body": {"action": "getUser", "params": {}},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "http_responses": [
-                {
-                    "status_code": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "logs": [
-                "2025-05-22T15:20:30.123Z ERROR [UserService] - Exception while processing user request",
-                "2025-05-22T15:20:30.124Z ERROR [UserService] - java.lang.NullPointerException: Cannot invoke method getUser() on null object",
-                "2025-05-22T15:20:30.125Z ERROR [UserService] - at com.example.service.UserService.processUserRequest(UserService.java:42)",
-                "2025-05-22T15:20:30.126Z ERROR [UserService] - at com.example.controller.UserController.handleRequest(UserController.java:28)",
-                "2025-05-22T15:20:30.127Z ERROR [UserService] - at com.example.api.ApiHandler.handleApiRequest(ApiHandler.java:15)"
-            ]
-        }
-    
-    def _get_python_stack_trace(self) -> Dict[str, Any]:
-        """
-        Get a dummy Python stack trace.
+        The dummy contexts are encoded once at import, so only the cached
+        event timestamp is filled in here.
         
+        Args:
+            arguments: The arguments for the tool
+            
         Returns:
-            A dummy cause context with a Python stack trace
+            The cause context information as JSON bytes
         """
-        return {
-            "stack_trace": {
-                "exception_type": "AttributeError",
-                "exception_message": "'NoneType' object has no attribute 'get_user'",
-                "frames": [
-                    {
-                        "file_path": "app/services/user_service.py",
-                        "line_number": 25,
-                        "method_name": "process_user_request",
-                        "code_line": "return user_request.get_user().id"
-                    },
-                    {
-                        "file_path": "app/controllers/user_controller.py",
-                        "line_number": 18,
-                        "method_name": "handle_request",
-                        "code_line": "user = user_service.process_user_request(request)"
-                    },
-                    {
-                        "file_path": "app/api/api_handler.py",
-                        "line_number": 10,
-                        "method_name": "handle_api_request",
-                        "code_line": "return user_controller.handle_request(request)"
-                    }
-                ]
-            },
-            "http_requests": [
-                {
-                    "method": "POST",
-                    "url": "https://api.example.com/users",
-                    "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
-                    "body": {"action": "get_user", "params": {}},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "http_responses": [
-                {
-                    "status_code": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "logs": [
-                "2025-05-22 15:20:30,123 - ERROR - [user_service] - Exception while processing user request",
-                "2025-05-22 15:20:30,124 - ERROR - [user_service] - AttributeError: 'NoneType' object has no attribute 'get_user'",
-                "2025-05-22 15:20:30,125 - ERROR - [user_service] - File \"app/services/user_service.py\", line 25, in process_user_request",
-                "2025-05-22 15:20:30,126 - ERROR - [user_service] - return user_request.get_user().id",
-                "2025-05-22 15:20:30,127 - ERROR - [user_service] - File \"app/controllers/user_controller.py\", line 18, in handle_request",
-                "2025-05-22 15:20:30,128 - ERROR - [user_service] - user = user_service.process_user_request(request)",
-                "2025-05-22 15:20:30,129 - ERROR - [user_service] - File \"app/api/api_handler.py\", line 10, in handle_api_request",
-                "2025-05-22 15:20:30,130 - ERROR - [user_service] - return user_controller.handle_request(request)"
-            ]
-        }
-    
-    def _get_node_stack_trace(self) -> Dict[str, Any]:
-        """
-        Get a dummy Node.js stack trace.
+        event_transaction_id = arguments.get("eventTransactionId")
         
-        Returns:
-            A dummy cause context with a Node.js stack trace
-        """
-        return {
-            "stack_trace": {
-                "exception_type": "TypeError",
-                "exception_message": "Cannot read property 'getUser' of null",
-                "frames": [
-                    {
-                        "file_path": "src/services/userService.js",
-                        "line_number": 15,
-                        "method_name": "processUserRequest",
-                        "code_line": "return userRequest.getUser().getId();"
-                    },
-                    {
-                        "file_path": "src/controllers/userController.js",
-                        "line_number": 10,
-                        "method_name": "handleRequest",
-                        "code_line": "const user = userService.processUserRequest(request);"
-                    },
-                    {
-                        "file_path": "src/api/apiHandler.js",
-                        "line_number": 8,
-                        "method_name": "handleApiRequest",
-                        "code_line": "return userController.handleRequest(request);"
-                    }
-                ]
-            },
-            "http_requests": [
-                {
-                    "method": "POST",
-                    "url": "https://api.example.com/users",
-                    "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
-                    "body": {"action": "getUser", "params": {}},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "http_responses": [
-                {
-                    "status_code": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "logs": [
-                "2025-05-22T15:20:30.123Z ERROR [userService] - Exception while processing user request",
-                "2025-05-22T15:20:30.124Z ERROR [userService] - TypeError: Cannot read property 'getUser' of null",
-                "2025-05-22T15:20:30.125Z ERROR [userService] - at processUserRequest (/app/src/services/userService.js:15:28)",
-                "2025-05-22T15:20:30.126Z ERROR [userService] - at handleRequest (/app/src/controllers/userController.js:10:22)",
-                "2025-05-22T15:20:30.127Z ERROR [userService] - at handleApiRequest (/app/src/api/apiHandler.js:8:16)"
-            ]
-        }
-    
-    def _get_generic_cause_context(self) -> Dict[str, Any]:
-        """
-        Get a generic cause context without a stack trace.
+        logger.info("Getting cause context for transaction ID: %s", event_transaction_id)
         
-        Returns:
-            A generic cause context
-        """
-        return {
-            "http_requests": [
-                {
-                    "method": "POST",
-                    "url": "https://api.example.com/data",
-                    "headers": {"Content-Type": "application/json", "Authorization": "Bearer ..."},
-                    "body": {"action": "getData", "params": {"id": "123"}},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "http_responses": [
-                {
-                    "status_code": 500,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": {"error": "Internal Server Error", "message": "An unexpected error occurred"},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ],
-            "logs": [
-                "2025-05-22T15:20:30.123Z ERROR [DataService] - Failed to process request",
-                "2025-05-22T15:20:30.124Z ERROR [DataService] - Error details: Connection timeout",
-                "2025-05-22T15:20:30.125Z ERROR [DataService] - Request ID: REQ-123456"
-            ],
-            "kafka_messages": [
-                {
-                    "topic": "data-events",
-                    "partition": 0,
-                    "offset": 12345,
-                    "key": "user-123",
-                    "value": {"event": "data-request", "userId": "123", "timestamp": "2025-05-22T15:20:25Z"},
-                    "timestamp": datetime.now().isoformat(),
-                    "headers": {"source": "web-api", "version": "1.0"}
-                }
-            ],
-            "database_errors": [
-                {
-                    "error_code": "ER_LOCK_WAIT_TIMEOUT",
-                    "error_message": "Lock wait timeout exceeded; try restarting transaction",
-                    "query": "SELECT * FROM users WHERE id = ?",
-                    "parameters": {"id": "123"},
-                    "timestamp": datetime.now().isoformat()
-                }
-            ]
-        }
+        body = _CAUSE_CONTEXT_JSON.get(
+            _transaction_prefix(event_transaction_id), _GENERIC_CAUSE_CONTEXT_JSON
+        )
+        
+        return body.replace(_NULL_TIMESTAMP, _current_timestamp()[1])
 
 
 # Create an instance of the server
@@ -1,5 +1,8 @@
 import os
+import re
 import json
+import time
+import functools
 import logging
 from typing import Dict, Any, List, Optional
 import asyncio
@@ -10,6 +13,358 @@ from sahur_core.mcp_server import MCPServer, Tool, Resource, Schema
 logger = logging.getLogger(__name__)
 
 
+# Dummy history contexts, built once. Dates are given as the number of days
+# before now and converted to timestamps by _stamp().
+_NULL_POINTER_HISTORY = {
+    "similar_issues": [
+        {
+            "issue_id": "ISSUE-456",
+            "title": "NullPointerException in UserService.processUserRequest",
+            "description": "Users are getting 500 errors when trying to access their profile",
+            "root_cause": "The UserRequest object was not properly initialized before calling getUser()",
+            "solution": "Added null check before calling getUser() and proper error handling",
+            "similarity_score": 0.92,
+            "resolved_at": 37
+        },
+        {
+            "issue_id": "ISSUE-789",
+            "title": "500 error on user profile page",
+            "description": "After the latest deployment, users are unable to view their profiles",
+            "root_cause": "The user object is null when the session has expired",
+            "solution": "Added session validation and redirect to login page when session is invalid",
+            "similarity_score": 0.78,
+            "resolved_at": 21
+        },
+        {
+            "issue_id": "ISSUE-1024",
+            "title": "API returns 500 error when fetching user data",
+            "description": "The API endpoint /api/users/{id} is returning 500 errors for some users",
+            "root_cause": "The user preferences are null for newly created users",
+            "solution": "Initialize default preferences when creating new users",
+            "similarity_score": 0.65,
+            "resolved_at": 14
+        }
+    ],
+    "relevant_code_changes": {
+        "com/example/service/UserService.java": "Commit abc123: Refactored user request handling",
+        "com/example/controller/UserController.java": "Commit def456: Updated API endpoint parameters",
+        "com/example/model/User.java": "Commit ghi789: Added default preferences initialization"
+    },
+    "deployment_events": [
+        {
+            "id": "DEPLOY-123",
+            "timestamp": 2,
+            "version": "v2.3.4",
+            "changes": ["Updated user service", "Fixed authentication bug"]
+        },
+        {
+            "id": "DEPLOY-122",
+            "timestamp": 8,
+            "version": "v2.3.3",
+            "changes": ["Added new user preferences feature", "Performance improvements"]
+        }
+    ]
+}
+
+_TIMEOUT_HISTORY = {
+    "similar_issues": [
+        {
+            "issue_id": "ISSUE-234",
+            "title": "API requests timing out during peak hours",
+            "description": "Users are experiencing timeouts when making API requests during peak hours",
+            "root_cause": "Connection pool exhaustion due to increased load",
+            "solution": "Increased connection pool size and added retry mechanism",
+            "similarity_score": 0.88,
+            "resolved_at": 45
+        },
+        {
+            "issue_id": "ISSUE-567",
+            "title": "Database queries timing out",
+            "description": "Some database queries are taking too long and timing out",
+            "root_cause": "Missing index on frequently queried column",
+            "solution": "Added index to improve query performance",
+            "similarity_score": 0.72,
+            "resolved_at": 30
+        },
+        {
+            "issue_id": "ISSUE-890",
+            "title": "External API integration timing out",
+            "description": "Calls to the payment gateway API are timing out",
+            "root_cause": "Network latency and no timeout configuration",
+            "solution": "Added timeout configuration and circuit breaker pattern",
+            "similarity_score": 0.65,
+            "resolved_at": 15
+        }
+    ],
+    "relevant_code_changes": {
+        "com/example/config/DatabaseConfig.java": "Commit jkl012: Optimized database connection pool",
+        "com/example/service/ApiClient.java": "Commit mno345: Added timeout and retry configuration",
+        "com/example/repository/UserRepository.java": "Commit pqr678: Optimized query with index"
+    },
+    "deployment_events": [
+        {
+            "id": "DEPLOY-120",
+            "timestamp": 5,
+            "version": "v2.3.2",
+            "changes": ["Optimized database connections", "Added API timeout configuration"]
+        },
+        {
+            "id": "DEPLOY-119",
+            "timestamp": 12,
+            "version": "v2.3.1",
+            "changes": ["Added circuit breaker for external APIs", "Performance monitoring"]
+        }
+    ]
+}
+
+_MEMORY_LEAK_HISTORY = {
+    "similar_issues": [
+        {
+            "issue_id": "ISSUE-345",
+            "title": "Application memory usage growing over time",
+            "description": "The application's memory usage is continuously growing, requiring frequent restarts",
+            "root_cause": "Cache not properly evicting old entries",
+            "solution": "Implemented time-based cache eviction policy",
+            "similarity_score": 0.91,
+            "resolved_at": 60
+        },
+        {
+            "issue_id": "ISSUE-678",
+            "title": "Memory leak in image processing service",
+            "description": "The image processing service is leaking memory when handling large images",
+            "root_cause": "Temporary files not being deleted after processing",
+            "solution": "Added proper cleanup in finally block",
+            "similarity_score": 0.75,
+            "resolved_at": 42
+        },
+        {
+            "issue_id": "ISSUE-901",
+            "title": "OutOfMemoryError in production",
+            "description": "The application is crashing with OutOfMemoryError after running for a few days",
+            "root_cause": "Connection objects not being closed properly",
+            "solution": "Implemented try-with-resources for all connections",
+            "similarity_score": 0.68,
+            "resolved_at": 28
+        }
+    ],
+    "relevant_code_changes": {
+        "com/example/cache/CacheManager.java": "Commit stu901: Implemented cache eviction policy",
+        "com/example/service/ImageProcessor.java": "Commit vwx234: Fixed resource cleanup",
+        "com/example/util/ConnectionManager.java": "Commit yz567: Refactored to use try-with-resources"
+    },
+    "deployment_events": [
+        {
+            "id": "DEPLOY-118",
+            "timestamp": 7,
+            "version": "v2.3.0",
+            "changes": ["Memory optimization", "Resource management improvements"]
+        },
+        {
+            "id": "DEPLOY-117",
+            "timestamp": 14,
+            "version": "v2.2.9",
+            "changes": ["Added memory monitoring", "Fixed resource leaks"]
+        }
+    ]
+}
+
+_DATABASE_ERROR_HISTORY = {
+    "similar_issues": [
+        {
+            "issue_id": "ISSUE-456",
+            "title": "Database connection errors during peak load",
+            "description": "Users are experiencing errors when the system is under heavy load",
+            "root_cause": "Connection pool exhaustion",
+            "solution": "Increased connection pool size and added connection timeout",
+            "similarity_score": 0.89,
+            "resolved_at": 50
+        },
+        {
+            "issue_id": "ISSUE-789",
+            "title": "Deadlock errors in transaction processing",
+            "description": "Concurrent transactions are causing deadlock errors",
+            "root_cause": "Inconsistent order of table locks",
+            "solution": "Standardized the order of operations in transactions",
+            "similarity_score": 0.76,
+            "resolved_at": 35
+        },
+        {
+            "issue_id": "ISSUE-1024",
+            "title": "Slow database queries affecting performance",
+            "description": "Some pages are loading very slowly due to database query performance",
+            "root_cause": "Missing indexes on frequently queried columns",
+            "solution": "Added appropriate indexes and optimized queries",
+            "similarity_score": 0.67,
+            "resolved_at": 20
+        }
+    ],
+    "relevant_code_changes": {
+        "com/example/config/DatabaseConfig.java": "Commit abc123: Optimized connection pool settings",
+        "com/example/repository/OrderRepository.java": "Commit def456: Standardized transaction order",
+        "com/example/repository/ProductRepository.java": "Commit ghi789: Optimized queries with indexes"
+    },
+    "deployment_events": [
+        {
+            "id": "DEPLOY-116",
+            "timestamp": 10,
+            "version": "v2.2.8",
+            "changes": ["Database performance optimizations", "Connection pool tuning"]
+        },
+        {
+            "id": "DEPLOY-115",
+            "timestamp": 18,
+            "version": "v2.2.7",
+            "changes": ["Added database monitoring", "Query optimization"]
+        }
+    ]
+}
+
+_GENERIC_HISTORY = {
+    "similar_issues": [
+        {
+            "issue_id": "ISSUE-123",
+            "title": "Error processing user requests",
+            "description": "Users are experiencing errors when submitting forms",
+            "root_cause": "Input validation not handling special characters correctly",
+            "solution": "Updated input validation to properly handle special characters",
+            "similarity_score": 0.65,
+            "resolved_at": 40
+        },
+        {
+            "issue_id": "ISSUE-456",
+            "title": "Intermittent errors in payment processing",
+            "description": "Some payment transactions are failing with generic error messages",
+            "root_cause": "Race condition in payment confirmation",
+            "solution": "Added transaction locking to prevent race conditions",
+            "similarity_score": 0.55,
+            "resolved_at": 25
+        }
+    ],
+    "relevant_code_changes": {
+        "com/example/controller/FormController.java": "Commit abc123: Improved input validation",
+        "com/example/service/PaymentService.java": "Commit def456: Fixed race condition in payment processing"
+    },
+    "deployment_events": [
+        {
+            "id": "DEPLOY-114",
+            "timestamp": 15,
+            "version": "v2.2.6",
+            "changes": ["Bug fixes", "Performance improvements"]
+        }
+    ]
+}
+
+# Templates by the kind of issue they are used for
+_HISTORY_TEMPLATES = {
+    "null_pointer": _NULL_POINTER_HISTORY,
+    "timeout": _TIMEOUT_HISTORY,
+    "memory_leak": _MEMORY_LEAK_HISTORY,
+    "database_error": _DATABASE_ERROR_HISTORY,
+    "generic": _GENERIC_HISTORY,
+}
+
+# Keywords that pick the kind of an issue, with one named group per kind.
+# Kinds are listed in priority order, for descriptions matching several.
+_KEYWORD_RE = re.compile(
+    r"(?P<null_pointer>null)"
+    r"|(?P<timeout>timeout|connection)"
+    r"|(?P<memory_leak>memory|leak)"
+    r"|(?P<database_error>database|sql)",
+    re.IGNORECASE,
+)
+_KIND_PRIORITY = ("null_pointer", "timeout", "memory_leak", "database_error")
+
+
+# Maximum number of issue descriptions whose kind is remembered
+ISSUE_KIND_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=ISSUE_KIND_CACHE_SIZE)
+def _issue_kind(issue_description: str) -> str:
+    """
+    Pick the kind of an issue from keywords in its description.
+    
+    The description is scanned once for all keywords, and the kind is
+    remembered so repeated descriptions are not scanned again.
+    
+    Args:
+        issue_description: The description of the issue
+        
+    Returns:
+        A key of _HISTORY_TEMPLATES
+    """
+    kinds = {match.lastgroup for match in _KEYWORD_RE.finditer(issue_description)}
+    
+    for kind in _KIND_PRIORITY:
+        if kind in kinds:
+            return kind
+    
+    return "generic"
+
+
+# How long, in seconds, a stamped history context is reused
+HISTORY_CACHE_INTERVAL = 60
+
+
+def _days_ago(now: datetime, days: int) -> str:
+    """
+    Format the time a number of days before now.
+    
+    Args:
+        now: The current time
+        days: The number of days
+        
+    Returns:
+        The ISO timestamp
+    """
+    return (now - timedelta(days=days)).isoformat()
+
+
+def _stamp(template: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """
+    Copy a history context template, converting its day offsets to timestamps.
+    
+    Only the similar issues and deployment events are copied; everything
+    else is shared with the template, so callers must not modify the result.
+    
+    Args:
+        template: The history context template
+        now: The time the offsets are relative to
+        
+    Returns:
+        The history context
+    """
+    return {
+        **template,
+        "similar_issues": [
+            {**issue, "resolved_at": _days_ago(now, issue["resolved_at"])}
+            for issue in template["similar_issues"]
+        ],
+        "deployment_events": [
+            {**event, "timestamp": _days_ago(now, event["timestamp"])}
+            for event in template["deployment_events"]
+        ],
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _history_context(kind: str, interval: int) -> Dict[str, Any]:
+    """
+    Get the dummy history context for a kind of issue.
+    
+    The interval only keys the cache, so each kind is stamped at most once
+    per HISTORY_CACHE_INTERVAL and calls within it share the result.
+    
+    Args:
+        kind: A key of _HISTORY_TEMPLATES
+        interval: The current HISTORY_CACHE_INTERVAL period
+        
+    Returns:
+        The history context, which callers must not modify
+    """
+    return _stamp(_HISTORY_TEMPLATES[kind], datetime.now())
+
+
 class HistoryContextServer(MCPServer):
     """
     MCP server for history context information.
@@ -57,305 +412,13 @@ class HistoryContextServer(MCPServer):
         """
         issue_description = arguments.get("issueDescription", "")
         
-        logger.info(f"Getting history context for issue: {issue_description[:50]}...")
+        logger.info("Getting history context for issue: %.50s...", issue_description)
         
         # In a real implementation, this would retrieve actual data
         # For now, we'll return dummy data based on keywords in the description
+        kind = _issue_kind(issue_description)
         
-        if "null" in issue_description.lower() or "nullpointer" in issue_description.lower():
-            return self._get_null_pointer_history()
-        elif "timeout" in issue_description.lower() or "connection" in issue_description.lower():
-            return self._get_timeout_history()
-        elif "memory" in issue_description.lower() or "leak" in issue_description.lower():
-            return self._get_memory_leak_history()
-        elif "database" in issue_description.lower() or "sql" in issue_description.lower():
-            return self._get_database_error_history()
-        else:
-            return self._get_generic_history()
-    
-    def _get_null_pointer_history(self) -> Dict[str, Any]:
-        """
-        Get historical context for null pointer issues.
-        
-        Returns:
-            Historical context for null pointer issues
-        """
-        now = datetime.now()
-        
-        return {
-            "similar_issues": [
-                {
-                    "issue_id": "ISSUE-456",
-                    "title": "NullPointerException in UserService.processUserRequest",
-                    "description": "Users are getting 500 errors when trying to access their profile",
-                    "root_cause": "The UserRequest object was not properly initialized before calling getUser()",
-                    "solution": "Added null check before calling getUser() and proper error handling",
-                    "similarity_score": 0.92,
-                    "resolved_at": (now - timedelta(days=37)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-789",
-                    "title": "500 error on user profile page",
-                    "description": "After the latest deployment, users are unable to view their profiles",
-                    "root_cause": "The user object is null when the session has expired",
-                    "solution": "Added session validation and redirect to login page when session is invalid",
-                    "similarity_score": 0.78,
-                    "resolved_at": (now - timedelta(days=21)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-1024",
-                    "title": "API returns 500 error when fetching user data",
-                    "description": "The API endpoint /api/users/{id} is returning 500 errors for some users",
-                    "root_cause": "The user preferences are null for newly created users",
-                    "solution": "Initialize default preferences when creating new users",
-                    "similarity_score": 0.65,
-                    "resolved_at": (now - timedelta(days=14)).isoformat()
-                }
-            ],
-            "relevant_code_changes": {
-                "com/example/service/UserService.java": "Commit abc123: Refactored user request handling",
-                "com/example/controller/UserController.java": "Commit def456: Updated API endpoint parameters",
-                "com/example/model/User.java": "Commit ghi789: Added default preferences initialization"
-            },
-            "deployment_events": [
-                {
-                    "id": "DEPLOY-123",
-                    "timestamp": (now - timedelta(days=2)).isoformat(),
-                    "version": "v2.3.4",
-                    "changes": ["Updated user service", "Fixed authentication bug"]
-                },
-                {
-                    "id": "DEPLOY-122",
-                    "timestamp": (now - timedelta(days=8)).isoformat(),
-                    "version": "v2.3.3",
-                    "changes": ["Added new user preferences feature", "Performance improvements"]
-                }
-            ]
-        }
-    
-    def _get_timeout_history(self) -> Dict[str, Any]:
-        """
-        Get historical context for timeout issues.
-        
-        Returns:
-            Historical context for timeout issues
-        """
-        now = datetime.now()
-        
-        return {
-            "similar_issues": [
-                {
-                    "issue_id": "ISSUE-234",
-                    "title": "API requests timing out during peak hours",
-                    "description": "Users are experiencing timeouts when making API requests during peak hours",
-                    "root_cause": "Connection pool exhaustion due to increased load",
-                    "solution": "Increased connection pool size and added retry mechanism",
-                    "similarity_score": 0.88,
-                    "resolved_at": (now - timedelta(days=45)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-567",
-                    "title": "Database queries timing out",
-                    "description": "Some database queries are taking too long and timing out",
-                    "root_cause": "Missing index on frequently queried column",
-                    "solution": "Added index to improve query performance",
-                    "similarity_score": 0.72,
-                    "resolved_at": (now - timedelta(days=30)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-890",
-                    "title": "External API integration timing out",
-                    "description": "Calls to the payment gateway API are timing out",
-                    "root_cause": "Network latency and no timeout configuration",
-                    "solution": "Added timeout configuration and circuit breaker pattern",
-                    "similarity_score": 0.65,
-                    "resolved_at": (now - timedelta(days=15)).isoformat()
-                }
-            ],
-            "relevant_code_changes": {
-                "com/example/config/DatabaseConfig.java": "Commit jkl012: Optimized database connection pool",
-                "com/example/service/ApiClient.java": "Commit mno345: Added timeout and retry configuration",
-                "com/example/repository/UserRepository.java": "Commit pqr678: Optimized query with index"
-            },
-            "deployment_events": [
-                {
-                    "id": "DEPLOY-120",
-                    "timestamp": (now - timedelta(days=5)).isoformat(),
-                    "version": "v2.3.2",
-                    "changes": ["Optimized database connections", "Added API timeout configuration"]
-                },
-                {
-                    "id": "DEPLOY-119",
-                    "timestamp": (now - timedelta(days=12)).isoformat(),
-                    "version": "v2.3.1",
-                    "changes": ["Added circuit breaker for external APIs", "Performance monitoring"]
-                }
-            ]
-        }
-    
-    def _get_memory_leak_history(self) -> Dict[str, Any]:
-        """
-        Get historical context for memory leak issues.
-        
-        Returns:
-            Historical context for memory leak issues
-        """
-        now = datetime.now()
-        
-        return {
-            "similar_issues": [
-                {
-                    "issue_id": "ISSUE-345",
-                    "title": "Application memory usage growing over time",
-                    "description": "The application's memory usage is continuously growing, requiring frequent restarts",
-                    "root_cause": "Cache not properly evicting old entries",
-                    "solution": "Implemented time-based cache eviction policy",
-                    "similarity_score": 0.91,
-                    "resolved_at": (now - timedelta(days=60)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-678",
-                    "title": "Memory leak in image processing service",
-                    "description": "The image processing service is leaking memory when handling large images",
-                    "root_cause": "Temporary files not being deleted after processing",
-                    "solution": "Added proper cleanup in finally block",
-                    "similarity_score": 0.75,
-                    "resolved_at": (now - timedelta(days=42)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-901",
-                    "title": "OutOfMemoryError in production",
-                    "description": "The application is crashing with OutOfMemoryError after running for a few days",
-                    "root_cause": "Connection objects not being closed properly",
-                    "solution": "Implemented try-with-resources for all connections",
-                    "similarity_score": 0.68,
-                    "resolved_at": (now - timedelta(days=28)).isoformat()
-                }
-            ],
-            "relevant_code_changes": {
-                "com/example/cache/CacheManager.java": "Commit stu901: Implemented cache eviction policy",
-                "com/example/service/ImageProcessor.java": "Commit vwx234: Fixed resource cleanup",
-                "com/example/util/ConnectionManager.java": "Commit yz567: Refactored to use try-with-resources"
-            },
-            "deployment_events": [
-                {
-                    "id": "DEPLOY-118",
-                    "timestamp": (now - timedelta(days=7)).isoformat(),
-                    "version": "v2.3.0",
-                    "changes": ["Memory optimization", "Resource management improvements"]
-                },
-                {
-                    "id": "DEPLOY-117",
-                    "timestamp": (now - timedelta(days=14)).isoformat(),
-                    "version": "v2.2.9",
-                    "changes": ["Added memory monitoring", "Fixed resource leaks"]
-                }
-            ]
-        }
-    
-    def _get_database_error_history(self) -> Dict[str, Any]:
-        """
-        Get historical context for database error issues.
-        
-        Returns:
-            Historical context for database error issues
-        """
-        now = datetime.now()
-        
-        return {
-            "similar_issues": [
-                {
-                    "issue_id": "ISSUE-456",
-                    "title": "Database connection errors during peak load",
-                    "description": "Users are experiencing errors when the system is under heavy load",
-                    "root_cause": "Connection pool exhaustion",
-                    "solution": "Increased connection pool size and added connection timeout",
-                    "similarity_score": 0.89,
-                    "resolved_at": (now - timedelta(days=50)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-789",
-                    "title": "Deadlock errors in transaction processing",
-                    "description": "Concurrent transactions are causing deadlock errors",
-                    "root_cause": "Inconsistent order of table locks",
-                    "solution": "Standardized the order of operations in transactions",
-                    "similarity_score": 0.76,
-                    "resolved_at": (now - timedelta(days=35)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-1024",
-                    "title": "Slow database queries affecting performance",
-                    "description": "Some pages are loading very slowly due to database query performance",
-                    "root_cause": "Missing indexes on frequently queried columns",
-                    "solution": "Added appropriate indexes and optimized queries",
-                    "similarity_score": 0.67,
-                    "resolved_at": (now - timedelta(days=20)).isoformat()
-                }
-            ],
-            "relevant_code_changes": {
-                "com/example/config/DatabaseConfig.java": "Commit abc123: Optimized connection pool settings",
-                "com/example/repository/OrderRepository.java": "Commit def456: Standardized transaction order",
-                "com/example/repository/ProductRepository.java": "Commit ghi789: Optimized queries with indexes"
-            },
-            "deployment_events": [
-                {
-                    "id": "DEPLOY-116",
-                    "timestamp": (now - timedelta(days=10)).isoformat(),
-                    "version": "v2.2.8",
-                    "changes": ["Database performance optimizations", "Connection pool tuning"]
-                },
-                {
-                    "id": "DEPLOY-115",
-                    "timestamp": (now - timedelta(days=18)).isoformat(),
-                    "version": "v2.2.7",
-                    "changes": ["Added database monitoring", "Query optimization"]
-                }
-            ]
-        }
-    
-    def _get_generic_history(self) -> Dict[str, Any]:
-        """
-        Get generic historical context.
-        
-        Returns:
-            Generic historical context
-        """
-        now = datetime.now()
-        
-        return {
-            "similar_issues": [
-                {
-                    "issue_id": "ISSUE-123",
-                    "title": "Error processing user requests",
-                    "description": "Users are experiencing errors when submitting forms",
-                    "root_cause": "Input validation not handling special characters correctly",
-                    "solution": "Updated input validation to properly handle special characters",
-                    "similarity_score": 0.65,
-                    "resolved_at": (now - timedelta(days=40)).isoformat()
-                },
-                {
-                    "issue_id": "ISSUE-456",
-                    "title": "Intermittent errors in payment processing",
-                    "description": "Some payment transactions are failing with generic error messages",
-                    "root_cause": "Race condition in payment confirmation",
-                    "solution": "Added transaction locking to prevent race conditions",
-                    "similarity_score": 0.55,
-                    "resolved_at": (now - timedelta(days=25)).isoformat()
-                }
-            ],
-            "relevant_code_changes": {
-                "com/example/controller/FormController.java": "Commit abc123: Improved input validation",
-                "com/example/service/PaymentService.java": "Commit def456: Fixed race condition in payment processing"
-            },
-            "deployment_events": [
-                {
-                    "id": "DEPLOY-114",
-                    "timestamp": (now - timedelta(days=15)).isoformat(),
-                    "version": "v2.2.6",
-                    "changes": ["Bug fixes", "Performance improvements"]
-                }
-            ]
-        }
+        return _history_context(kind, int(time.time() // HISTORY_CACHE_INTERVAL))
 
 
 # Create an instance of the server
@@ -0,0 +1,36 @@
+-- Convert String(36) primary/foreign keys to native UUID columns with
+-- server-side defaults. Fresh databases get this schema from
+-- create_tables(); run this once against databases created before.
+
+BEGIN;
+
+ALTER TABLE issue_tracking DROP CONSTRAINT IF EXISTS issue_tracking_issue_id_fkey;
+ALTER TABLE issue_messages DROP CONSTRAINT IF EXISTS issue_messages_issue_id_fkey;
+
+ALTER TABLE issues
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN id SET DEFAULT gen_random_uuid();
+
+ALTER TABLE issue_tracking
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN id SET DEFAULT gen_random_uuid(),
+    ALTER COLUMN issue_id TYPE uuid USING issue_id::uuid;
+
+ALTER TABLE issue_messages
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN id SET DEFAULT gen_random_uuid(),
+    ALTER COLUMN issue_id TYPE uuid USING issue_id::uuid;
+
+ALTER TABLE users
+    ALTER COLUMN id TYPE uuid USING id::uuid,
+    ALTER COLUMN id SET DEFAULT gen_random_uuid();
+
+ALTER TABLE issue_tracking
+    ADD CONSTRAINT issue_tracking_issue_id_fkey
+    FOREIGN KEY (issue_id) REFERENCES issues (id);
+
+ALTER TABLE issue_messages
+    ADD CONSTRAINT issue_messages_issue_id_fkey
+    FOREIGN KEY (issue_id) REFERENCES issues (id);
+
+COMMIT;
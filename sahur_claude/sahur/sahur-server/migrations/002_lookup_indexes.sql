@@ -0,0 +1,16 @@
+-- Index the foreign keys and filter columns used on hot lookup paths.
+-- PostgreSQL does not index foreign keys automatically. Fresh databases
+-- get these from create_tables(). CREATE INDEX CONCURRENTLY cannot run
+-- inside a transaction block, so run this file without BEGIN/COMMIT.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issue_tracking_issue_id
+    ON issue_tracking (issue_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issue_messages_issue_id
+    ON issue_messages (issue_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_event_transaction_id
+    ON issues (event_transaction_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issues_status
+    ON issues (status);
@@ -0,0 +1,21 @@
+-- Generate created_at/updated_at/timestamp values in the database.
+-- Fresh databases get these defaults from create_tables().
+
+BEGIN;
+
+ALTER TABLE issues
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', clock_timestamp()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', clock_timestamp());
+
+ALTER TABLE issue_tracking
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', clock_timestamp()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', clock_timestamp());
+
+ALTER TABLE issue_messages
+    ALTER COLUMN timestamp SET DEFAULT timezone('utc', clock_timestamp());
+
+ALTER TABLE users
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', clock_timestamp()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', clock_timestamp());
+
+COMMIT;
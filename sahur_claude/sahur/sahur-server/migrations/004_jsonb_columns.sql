@@ -0,0 +1,14 @@
+-- Store JSON payloads as jsonb instead of json text.
+-- Fresh databases get this schema from create_tables().
+
+BEGIN;
+
+ALTER TABLE issues
+    ALTER COLUMN additional_metadata TYPE jsonb USING additional_metadata::jsonb;
+
+ALTER TABLE issue_tracking
+    ALTER COLUMN cause_context TYPE jsonb USING cause_context::jsonb,
+    ALTER COLUMN history_context TYPE jsonb USING history_context::jsonb,
+    ALTER COLUMN solution TYPE jsonb USING solution::jsonb;
+
+COMMIT;
@@ -1,11 +1,12 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from sahur_server.api.issues import router as issues_router
 from sahur_server.api.slack import router as slack_router
 from sahur_server.api.health import router as health_router
 
-# Create the main API router
-api_router = APIRouter()
+# Create the main API router; responses are encoded with orjson
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include the routers
 api_router.include_router(issues_router, prefix="/issues", tags=["issues"])
@@ -1,20 +1,45 @@
+import functools
+import time
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from sahur_server.models import HealthResponse
 
 router = APIRouter()
 
+# How often, in seconds, the health check response is rebuilt
+HEALTH_REFRESH_INTERVAL = 1
 
-@router.get("/", response_model=HealthResponse)
-def health_check():
+
+@functools.lru_cache(maxsize=1)
+def _health_body(interval: int) -> bytes:
     """
-    Health check endpoint.
+    Build the encoded health check response.
     
-    This endpoint is used to check if the server is running.
+    The interval argument only keys the cache: the response is rebuilt once
+    per HEALTH_REFRESH_INTERVAL and probes within it share the same bytes.
+    
+    Args:
+        interval: The current HEALTH_REFRESH_INTERVAL period
+        
+    Returns:
+        The JSON-encoded health check response
     """
     return HealthResponse(
         status="ok",
         version="0.1.0",
         timestamp=datetime.utcnow(),
+    ).model_dump_json().encode()
+
+
+@router.get("/", response_model=HealthResponse)
+async def health_check():
+    """
+    Health check endpoint.
+    
+    This endpoint is used to check if the server is running.
+    """
+    return Response(
+        content=_health_body(int(time.time() // HEALTH_REFRESH_INTERVAL)),
+        media_type="application/json",
     )
@@ -1,9 +1,15 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
+import asyncio
+from typing import Iterator, List, Optional
+from fastapi import APIRouter, Depends, status, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from sahur_server.database import get_db
+from sahur_server.database import get_db, SessionLocal
+from sahur_server.database.models import Issue as DBIssue
 from sahur_server.models import (
+    IssueStatus,
+    IssueSource,
     IssueCreate,
     IssueUpdate,
     IssueResponse,
@@ -16,12 +22,14 @@ from sahur_server.models import (
 from sahur_server.services import (
     create_issue,
     get_issue,
-    get_issues,
+    iter_issue_chunks,
     update_issue,
     delete_issue,
     create_issue_tracking,
     get_issue_tracking,
     get_issue_tracking_by_issue_id,
+    get_issue_tracking_by_issue_id_or_none,
+    get_issue_trackings_by_issue_ids,
     update_issue_tracking,
     create_issue_message,
     get_issue_messages,
@@ -31,6 +39,38 @@ from sahur_server.websockets import manager
 
 router = APIRouter()
 
+# Number of issues fetched and written per chunk when streaming the issue list
+ISSUE_STREAM_CHUNK_SIZE = 50
+
+
+def issue_response_from_orm(db_issue: DBIssue, tracking_id: Optional[str]) -> IssueResponse:
+    """
+    Build an issue response from a database row without re-validating it.
+    
+    The row comes from our own database, whose columns already match the
+    response schema, so the model is constructed directly. Only the status
+    and source strings are mapped to their enums.
+    
+    Args:
+        db_issue: The issue database row
+        tracking_id: The ID of the issue tracking, if any
+        
+    Returns:
+        The issue response
+    """
+    return IssueResponse.model_construct(
+        id=db_issue.id,
+        title=db_issue.title,
+        description=db_issue.description,
+        status=IssueStatus(db_issue.status),
+        source=IssueSource(db_issue.source),
+        created_at=db_issue.created_at,
+        updated_at=db_issue.updated_at,
+        event_transaction_id=db_issue.event_transaction_id,
+        additional_metadata=db_issue.additional_metadata,
+        tracking_id=tracking_id,
+    )
+
 
 @router.post("/", response_model=IssueResponse, status_code=status.HTTP_201_CREATED)
 def create_issue_endpoint(issue_create: IssueCreate, db: Session = Depends(get_db)):
@@ -51,10 +91,7 @@ def create_issue_endpoint(issue_create: IssueCreate, db: Session = Depends(get_d
     update_issue_tracking(db, db_tracking.id, tracking_update)
     
     # Create response with tracking ID
-    response = IssueResponse.model_validate(db_issue)
-    response.tracking_id = db_tracking.id
-    
-    return response
+    return issue_response_from_orm(db_issue, db_tracking.id)
 
 
 @router.get("/{issue_id}", response_model=IssueResponse)
@@ -65,17 +102,59 @@ def get_issue_endpoint(issue_id: str, db: Session = Depends(get_db)):
     db_issue = get_issue(db, issue_id)
     
     # Get tracking ID if available
-    try:
-        db_tracking = get_issue_tracking_by_issue_id(db, issue_id)
-        tracking_id = db_tracking.id
-    except HTTPException:
-        tracking_id = None
+    db_tracking = get_issue_tracking_by_issue_id_or_none(db, issue_id)
+    tracking_id = db_tracking.id if db_tracking is not None else None
     
     # Create response with tracking ID
-    response = IssueResponse.model_validate(db_issue)
-    response.tracking_id = tracking_id
+    return issue_response_from_orm(db_issue, tracking_id)
+
+
+def _stream_issues(
+    skip: int, limit: int, status: Optional[str], source: Optional[str]
+) -> Iterator[str]:
+    """
+    Stream a list of issues as a JSON array.
     
-    return response
+    Each database chunk is written out as soon as it is fetched, together
+    with the tracking IDs for its issues.
+    
+    Args:
+        skip: Number of issues to skip
+        limit: Maximum number of issues to return
+        status: Filter by status
+        source: Filter by source
+        
+    Returns:
+        Iterator over pieces of the JSON array
+    """
+    # The stream outlives the request's dependencies, so it owns its session
+    db = SessionLocal()
+    try:
+        yield "["
+        
+        separator = ""
+        for db_issues in iter_issue_chunks(
+            db, skip, limit, status, source, ISSUE_STREAM_CHUNK_SIZE
+        ):
+            # Get the tracking for the issues in this chunk in one query
+            db_trackings = get_issue_trackings_by_issue_ids(
+                db, [db_issue.id for db_issue in db_issues]
+            )
+            
+            items = []
+            for db_issue in db_issues:
+                # Get tracking ID if available
+                db_tracking = db_trackings.get(db_issue.id)
+                tracking_id = db_tracking.id if db_tracking is not None else None
+                
+                items.append(issue_response_from_orm(db_issue, tracking_id).model_dump_json())
+            
+            yield separator + ",".join(items)
+            separator = ","
+        
+        yield "]"
+    finally:
+        db.close()
 
 
 @router.get("/", response_model=List[IssueResponse])
@@ -84,28 +163,13 @@ def get_issues_endpoint(
     limit: int = 100,
     status: Optional[str] = None,
     source: Optional[str] = None,
-    db: Session = Depends(get_db),
 ):
     """
     Get a list of issues.
     """
-    db_issues = get_issues(db, skip, limit, status, source)
-    
-    # Create responses with tracking IDs
-    responses = []
-    for db_issue in db_issues:
-        response = IssueResponse.model_validate(db_issue)
-        
-        # Get tracking ID if available
-        try:
-            db_tracking = get_issue_tracking_by_issue_id(db, db_issue.id)
-            response.tracking_id = db_tracking.id
-        except HTTPException:
-            response.tracking_id = None
-        
-        responses.append(response)
-    
-    return responses
+    return StreamingResponse(
+        _stream_issues(skip, limit, status, source), media_type="application/json"
+    )
 
 
 @router.put("/{issue_id}", response_model=IssueResponse)
@@ -116,17 +180,11 @@ def update_issue_endpoint(issue_id: str, issue_update: IssueUpdate, db: Session
     db_issue = update_issue(db, issue_id, issue_update)
     
     # Get tracking ID if available
-    try:
-        db_tracking = get_issue_tracking_by_issue_id(db, issue_id)
-        tracking_id = db_tracking.id
-    except HTTPException:
-        tracking_id = None
+    db_tracking = get_issue_tracking_by_issue_id_or_none(db, issue_id)
+    tracking_id = db_tracking.id if db_tracking is not None else None
     
     # Create response with tracking ID
-    response = IssueResponse.model_validate(db_issue)
-    response.tracking_id = tracking_id
-    
-    return response
+    return issue_response_from_orm(db_issue, tracking_id)
 
 
 @router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -135,6 +193,7 @@ def delete_issue_endpoint(issue_id: str, db: Session = Depends(get_db)):
     Delete an issue.
     """
     delete_issue(db, issue_id)
+    manager.forget_issue(issue_id)
     return None
 
 
@@ -178,8 +237,8 @@ async def create_issue_message_endpoint(
     # Override issue_id from path
     message_create.issue_id = issue_id
     
-    # Create the message
-    db_message = create_issue_message(db, message_create)
+    # Create the message off the event loop
+    db_message = await run_in_threadpool(create_issue_message, db, message_create)
     
     # Broadcast the message to WebSocket clients
     await manager.broadcast_message(
@@ -193,95 +252,83 @@ async def create_issue_message_endpoint(
 async def websocket_endpoint(websocket: WebSocket, issue_id: str, db: Session = Depends(get_db)):
     """
     WebSocket endpoint for real-time updates.
+    
+    Database calls run in the threadpool so they do not block the event loop
+    for the other connections.
     """
-    # Check if the issue exists
-    get_issue(db, issue_id)
+    # Check if the issue exists, unless it was confirmed recently
+    if not manager.is_known_issue(issue_id):
+        await run_in_threadpool(get_issue, db, issue_id)
+        manager.remember_issue(issue_id)
     
     # Connect the WebSocket
     await manager.connect(websocket, issue_id)
     
     try:
-        # Send initial messages
-        db_messages = get_issue_messages(db, issue_id)
-        for msg in db_messages:
-            await manager.send_personal_message(
-                {
-                    "type": "message",
-                    "role": msg.role,
-                    "content": msg.content,
-                    "issue_id": issue_id,
-                    "message_id": msg.id,
-                },
-                websocket,
-            )
+        # Send the message backlog as a single frame
+        db_messages = await run_in_threadpool(get_issue_messages, db, issue_id)
+        await manager.send_personal_message(
+            {
+                "type": "backlog",
+                "issue_id": issue_id,
+                "messages": [
+                    {
+                        "role": msg.role,
+                        "content": msg.content,
+                        "message_id": msg.id,
+                    }
+                    for msg in db_messages
+                ],
+            },
+            websocket,
+        )
         
-        # Send tracking information if available
-        try:
-            db_tracking = get_issue_tracking_by_issue_id(db, issue_id)
+        # Send tracking information if available, again as a single frame
+        db_tracking = await run_in_threadpool(
+            get_issue_tracking_by_issue_id_or_none, db, issue_id
+        )
+        if db_tracking is not None:
             await manager.send_personal_message(
                 {
-                    "type": "status",
-                    "status": db_tracking.status,
+                    "type": "snapshot",
                     "issue_id": issue_id,
+                    "status": db_tracking.status,
+                    "cause_context": db_tracking.cause_context,
+                    "history_context": db_tracking.history_context,
+                    "solution": db_tracking.solution,
                 },
                 websocket,
             )
-            
-            if db_tracking.cause_context:
-                await manager.send_personal_message(
-                    {
-                        "type": "context",
-                        "context_type": "cause_context",
-                        "context": db_tracking.cause_context,
-                        "issue_id": issue_id,
-                    },
-                    websocket,
-                )
-            
-            if db_tracking.history_context:
-                await manager.send_personal_message(
-                    {
-                        "type": "context",
-                        "context_type": "history_context",
-                        "context": db_tracking.history_context,
-                        "issue_id": issue_id,
-                    },
-                    websocket,
-                )
-            
-            if db_tracking.solution:
-                await manager.send_personal_message(
-                    {
-                        "type": "solution",
-                        "solution": db_tracking.solution,
-                        "issue_id": issue_id,
-                    },
-                    websocket,
-                )
-        except HTTPException:
-            pass
         
-        # Listen for messages from the client
-        while True:
-            data = await websocket.receive_json()
-            
-            # Handle user messages
-            if data.get("type") == "message":
-                content = data.get("content", "")
-                
-                # Create a new message
-                message_create = IssueMessageCreate(
-                    issue_id=issue_id,
-                    role="user",
-                    content=content,
-                )
-                
-                db_message = create_issue_message(db, message_create)
+        # Listen for messages from the client, reading the next frame while
+        # the current one is stored and broadcast
+        pending = asyncio.ensure_future(websocket.receive_json())
+        try:
+            while True:
+                frame = await pending
+                pending = asyncio.ensure_future(websocket.receive_json())
                 
-                # Broadcast the message to all clients
-                await manager.broadcast_message(
-                    db_message.role, db_message.content, issue_id, db_message.id
-                )
+                # Clients that batch frames send several messages as one JSON array
+                for data in frame if isinstance(frame, list) else (frame,):
+                    # Handle user messages
+                    if data.get("type") == "message":
+                        content = data.get("content", "")
+                        
+                        # Create a new message
+                        message_create = IssueMessageCreate(
+                            issue_id=issue_id,
+                            role="user",
+                            content=content,
+                        )
+                        
+                        db_message = await run_in_threadpool(create_issue_message, db, message_create)
+                        
+                        # Broadcast the message to all clients
+                        await manager.broadcast_message(
+                            db_message.role, db_message.content, issue_id, db_message.id
+                        )
+        finally:
+            pending.cancel()
     
     except WebSocketDisconnect:
         manager.disconnect(websocket, issue_id)
@@ -6,6 +6,7 @@ import logging
 from typing import Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status, Header
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from sahur_server.database import get_db
@@ -96,8 +97,8 @@ async def slack_events(
     if event_request.type == "event_callback":
         event_data = event_request.event
         
-        # Process the event
-        issue = process_slack_event(db, event_data)
+        # Process the event off the event loop
+        issue = await run_in_threadpool(process_slack_event, db, event_data)
         
         if issue:
             return {
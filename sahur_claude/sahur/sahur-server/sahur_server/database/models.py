@@ -1,27 +1,36 @@
-from datetime import datetime
 from typing import Dict, List, Optional, Any
-import uuid
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, JSON, Boolean, Enum
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Boolean, Enum, text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
 
+def utc_now():
+    """
+    Server-side current UTC timestamp, for timestamp column defaults.
+    
+    clock_timestamp() is used rather than now() so that rows written in
+    the same transaction still get distinct, ordered timestamps.
+    """
+    return func.timezone("utc", func.clock_timestamp())
+
+
 class Issue(Base):
     """Database model for issues."""
     __tablename__ = "issues"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()"))
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
-    status = Column(String(50), nullable=False)
+    status = Column(String(50), nullable=False, index=True)
     source = Column(String(50), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    event_transaction_id = Column(String(255), nullable=True)
-    additional_metadata = Column(JSON, nullable=True)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
+    event_transaction_id = Column(String(255), nullable=True, index=True)
+    additional_metadata = Column(JSONB, nullable=True)
 
     # Relationships
     tracking = relationship("IssueTracking", back_populates="issue", uselist=False)
@@ -32,15 +41,15 @@ class IssueTracking(Base):
     """Database model for issue tracking."""
     __tablename__ = "issue_tracking"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    issue_id = Column(String(36), ForeignKey("issues.id"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()"))
+    issue_id = Column(UUID(as_uuid=False), ForeignKey("issues.id"), nullable=False, index=True)
     status = Column(String(50), nullable=False)
     batch_process_id = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    cause_context = Column(JSON, nullable=True)
-    history_context = Column(JSON, nullable=True)
-    solution = Column(JSON, nullable=True)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
+    cause_context = Column(JSONB, nullable=True)
+    history_context = Column(JSONB, nullable=True)
+    solution = Column(JSONB, nullable=True)
     
     # Relationships
     issue = relationship("Issue", back_populates="tracking")
@@ -50,11 +59,11 @@ class IssueMessage(Base):
     """Database model for issue messages."""
     __tablename__ = "issue_messages"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    issue_id = Column(String(36), ForeignKey("issues.id"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()"))
+    issue_id = Column(UUID(as_uuid=False), ForeignKey("issues.id"), nullable=False, index=True)
     role = Column(String(50), nullable=False)  # system, user, assistant
     content = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, server_default=utc_now())
     
     # Relationships
     issue = relationship("Issue", back_populates="messages")
@@ -64,11 +73,11 @@ class User(Base):
     """Database model for users."""
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=False), primary_key=True, server_default=text("gen_random_uuid()"))
     username = Column(String(255), unique=True, nullable=False)
     email = Column(String(255), unique=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
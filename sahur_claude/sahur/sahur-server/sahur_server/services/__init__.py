@@ -2,11 +2,14 @@ from sahur_server.services.issue_service import (
     create_issue,
     get_issue,
     get_issues,
+    iter_issue_chunks,
     update_issue,
     delete_issue,
     create_issue_tracking,
     get_issue_tracking,
     get_issue_tracking_by_issue_id,
+    get_issue_tracking_by_issue_id_or_none,
+    get_issue_trackings_by_issue_ids,
     update_issue_tracking,
     create_issue_message,
     get_issue_messages,
@@ -18,11 +21,14 @@ __all__ = [
     "create_issue",
     "get_issue",
     "get_issues",
+    "iter_issue_chunks",
     "update_issue",
     "delete_issue",
     "create_issue_tracking",
     "get_issue_tracking",
     "get_issue_tracking_by_issue_id",
+    "get_issue_tracking_by_issue_id_or_none",
+    "get_issue_trackings_by_issue_ids",
     "update_issue_tracking",
     "create_issue_message",
     "get_issue_messages",
@@ -3,8 +3,8 @@ import uuid
 import subprocess
 import logging
 import sys
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from itertools import islice
+from typing import Iterator, List, Optional, Dict, Any
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
@@ -29,6 +29,27 @@ logger = logging.getLogger(__name__)
 BATCH_COMMAND = os.getenv("BATCH_COMMAND", "python -m sahur_batch.main")
 
 
+def _is_valid_uuid(value: str) -> bool:
+    """
+    Check whether a value is a well-formed UUID.
+    
+    IDs are stored in native UUID columns, so malformed values are
+    rejected up front instead of failing inside the database.
+    
+    Args:
+        value: The value to check
+        
+    Returns:
+        True if the value is a valid UUID, False otherwise
+    """
+    try:
+        uuid.UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        return False
+    
+    return True
+
+
 def create_issue(db: Session, issue_create: IssueCreate) -> DBIssue:
     """
     Create a new issue.
@@ -42,7 +63,6 @@ def create_issue(db: Session, issue_create: IssueCreate) -> DBIssue:
     """
     # Create the issue
     db_issue = DBIssue(
-        id=str(uuid.uuid4()),
         title=issue_create.title,
         description=issue_create.description,
         status=IssueStatus.CREATED.value,
@@ -72,6 +92,9 @@ def get_issue(db: Session, issue_id: str) -> DBIssue:
     Raises:
         HTTPException: If the issue is not found
     """
+    if not _is_valid_uuid(issue_id):
+        raise HTTPException(status_code=404, detail="Issue not found")
+    
     db_issue = db.query(DBIssue).filter(DBIssue.id == issue_id).first()
     
     if db_issue is None:
@@ -80,6 +103,29 @@ def get_issue(db: Session, issue_id: str) -> DBIssue:
     return db_issue
 
 
+def _issues_query(db: Session, status: Optional[str] = None, source: Optional[str] = None):
+    """
+    Build the query behind the issue list, newest issues first.
+    
+    Args:
+        db: Database session
+        status: Filter by status
+        source: Filter by source
+        
+    Returns:
+        The issue query
+    """
+    query = db.query(DBIssue)
+    
+    if status:
+        query = query.filter(DBIssue.status == status)
+    
+    if source:
+        query = query.filter(DBIssue.source == source)
+    
+    return query.order_by(DBIssue.created_at.desc())
+
+
 def get_issues(
     db: Session,
     skip: int = 0,
@@ -100,15 +146,44 @@ def get_issues(
     Returns:
         List of issues
     """
-    query = db.query(DBIssue)
+    return _issues_query(db, status, source).offset(skip).limit(limit).all()
+
+
+def iter_issue_chunks(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    chunk_size: int = 50,
+) -> Iterator[List[DBIssue]]:
+    """
+    Iterate over a list of issues in chunks.
     
-    if status:
-        query = query.filter(DBIssue.status == status)
+    Rows are fetched from the database chunk_size at a time, so only one
+    chunk is held in memory at once.
     
-    if source:
-        query = query.filter(DBIssue.source == source)
+    Args:
+        db: Database session
+        skip: Number of issues to skip
+        limit: Maximum number of issues to return
+        status: Filter by status
+        source: Filter by source
+        chunk_size: Number of issues per chunk
+        
+    Returns:
+        Iterator over lists of at most chunk_size issues
+    """
+    rows = iter(
+        _issues_query(db, status, source).offset(skip).limit(limit).yield_per(chunk_size)
+    )
     
-    return query.order_by(DBIssue.created_at.desc()).offset(skip).limit(limit).all()
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        
+        yield chunk
 
 
 def update_issue(db: Session, issue_id: str, issue_update: IssueUpdate) -> DBIssue:
@@ -141,8 +216,6 @@ def update_issue(db: Session, issue_id: str, issue_update: IssueUpdate) -> DBIss
     if issue_update.additional_metadata is not None:
         db_issue.additional_metadata = issue_update.additional_metadata
     
-    db_issue.updated_at = datetime.utcnow()
-    
     db.commit()
     db.refresh(db_issue)
     
@@ -182,7 +255,6 @@ def create_issue_tracking(db: Session, tracking_create: IssueTrackingCreate) ->
     
     # Create the issue tracking
     db_tracking = DBIssueTracking(
-        id=str(uuid.uuid4()),
         issue_id=tracking_create.issue_id,
         status=tracking_create.status.value,
     )
@@ -208,6 +280,9 @@ def get_issue_tracking(db: Session, tracking_id: str) -> DBIssueTracking:
     Raises:
         HTTPException: If the issue tracking is not found
     """
+    if not _is_valid_uuid(tracking_id):
+        raise HTTPException(status_code=404, detail="Issue tracking not found")
+    
     db_tracking = db.query(DBIssueTracking).filter(DBIssueTracking.id == tracking_id).first()
     
     if db_tracking is None:
@@ -216,6 +291,25 @@ def get_issue_tracking(db: Session, tracking_id: str) -> DBIssueTracking:
     return db_tracking
 
 
+def get_issue_tracking_by_issue_id_or_none(
+    db: Session, issue_id: str
+) -> Optional[DBIssueTracking]:
+    """
+    Get an issue tracking by issue ID, if there is one.
+    
+    Args:
+        db: Database session
+        issue_id: Issue ID
+        
+    Returns:
+        The issue tracking, or None if it is not found
+    """
+    if not _is_valid_uuid(issue_id):
+        return None
+    
+    return db.query(DBIssueTracking).filter(DBIssueTracking.issue_id == issue_id).first()
+
+
 def get_issue_tracking_by_issue_id(db: Session, issue_id: str) -> DBIssueTracking:
     """
     Get an issue tracking by issue ID.
@@ -230,7 +324,7 @@ def get_issue_tracking_by_issue_id(db: Session, issue_id: str) -> DBIssueTrackin
     Raises:
         HTTPException: If the issue tracking is not found
     """
-    db_tracking = db.query(DBIssueTracking).filter(DBIssueTracking.issue_id == issue_id).first()
+    db_tracking = get_issue_tracking_by_issue_id_or_none(db, issue_id)
     
     if db_tracking is None:
         raise HTTPException(status_code=404, detail="Issue tracking not found")
@@ -238,6 +332,31 @@ def get_issue_tracking_by_issue_id(db: Session, issue_id: str) -> DBIssueTrackin
     return db_tracking
 
 
+def get_issue_trackings_by_issue_ids(
+    db: Session, issue_ids: List[str]
+) -> Dict[str, DBIssueTracking]:
+    """
+    Get the issue trackings for several issues in one query.
+    
+    Args:
+        db: Database session
+        issue_ids: Issue IDs
+        
+    Returns:
+        Issue trackings by issue ID. Issues without a tracking are left out.
+    """
+    if not issue_ids:
+        return {}
+    
+    db_trackings = db.query(DBIssueTracking).filter(DBIssueTracking.issue_id.in_(issue_ids)).all()
+    
+    trackings: Dict[str, DBIssueTracking] = {}
+    for db_tracking in db_trackings:
+        trackings.setdefault(db_tracking.issue_id, db_tracking)
+    
+    return trackings
+
+
 def update_issue_tracking(
     db: Session, tracking_id: str, tracking_update: IssueTrackingUpdate
 ) -> DBIssueTracking:
@@ -273,8 +392,6 @@ def update_issue_tracking(
     if tracking_update.solution is not None:
         db_tracking.solution = tracking_update.solution
     
-    db_tracking.updated_at = datetime.utcnow()
-    
     db.commit()
     db.refresh(db_tracking)
     
@@ -297,7 +414,6 @@ def create_issue_message(db: Session, message_create: IssueMessageCreate) -> DBI
     
     # Create the issue message
     db_message = DBIssueMessage(
-        id=str(uuid.uuid4()),
         issue_id=message_create.issue_id,
         role=message_create.role,
         content=message_create.content,
@@ -1,12 +1,22 @@
 import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, Set, Any, Optional
 import asyncio
 
+import orjson
+
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+# How long, in seconds, a confirmed issue ID is trusted without a database check
+ISSUE_EXISTS_TTL = 60
+
+# Maximum number of confirmed issue IDs to remember
+ISSUE_EXISTS_CACHE_SIZE = 10000
+
 
 class ConnectionManager:
     """
@@ -20,6 +30,52 @@ class ConnectionManager:
         """Initialize the connection manager."""
         # Map of issue ID to set of connected WebSockets
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        
+        # Issue IDs known to exist, mapped to when that stops being trusted
+        self._known_issues: "OrderedDict[str, float]" = OrderedDict()
+    
+    def is_known_issue(self, issue_id: str) -> bool:
+        """
+        Check whether an issue was recently confirmed to exist.
+        
+        Args:
+            issue_id: The ID of the issue
+            
+        Returns:
+            True if the issue was confirmed within ISSUE_EXISTS_TTL seconds
+        """
+        expires_at = self._known_issues.get(issue_id)
+        if expires_at is None:
+            return False
+        
+        if expires_at <= time.monotonic():
+            del self._known_issues[issue_id]
+            return False
+        
+        return True
+    
+    def remember_issue(self, issue_id: str) -> None:
+        """
+        Record that an issue exists, so reconnects can skip the database check.
+        
+        Args:
+            issue_id: The ID of the issue
+        """
+        self._known_issues[issue_id] = time.monotonic() + ISSUE_EXISTS_TTL
+        self._known_issues.move_to_end(issue_id)
+        
+        # Drop the oldest entries once the cache is full
+        while len(self._known_issues) > ISSUE_EXISTS_CACHE_SIZE:
+            self._known_issues.popitem(last=False)
+    
+    def forget_issue(self, issue_id: str) -> None:
+        """
+        Forget that an issue exists, e.g. because it was deleted.
+        
+        Args:
+            issue_id: The ID of the issue
+        """
+        self._known_issues.pop(issue_id, None)
     
     async def connect(self, websocket: WebSocket, issue_id: str) -> None:
         """
@@ -79,18 +135,22 @@ class ConnectionManager:
         if issue_id not in self.active_connections:
             return
         
-        disconnected = set()
+        # Encode the message once for all clients. It is sent as a text frame,
+        # like send_json does, so browser clients can still JSON.parse it.
+        payload = orjson.dumps(message).decode()
         
-        for websocket in self.active_connections[issue_id]:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.exception(f"Error broadcasting message: {e}")
-                disconnected.add(websocket)
+        # Send to every client concurrently, so the slowest client sets the pace
+        websockets = list(self.active_connections[issue_id])
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for websocket in websockets),
+            return_exceptions=True,
+        )
         
         # Remove disconnected WebSockets
-        for websocket in disconnected:
-            self.disconnect(websocket, issue_id)
+        for websocket, result in zip(websockets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting message: {result}", exc_info=result)
+                self.disconnect(websocket, issue_id)
     
     async def broadcast_message(
         self, role: str, content: str, issue_id: str, message_id: Optional[str] = None
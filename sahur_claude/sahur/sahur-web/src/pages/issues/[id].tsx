@@ -62,6 +62,16 @@ const useIssueWebSocket = (issueId: string) => {
 
       if (data.type === 'message') {
         setMessages((prev) => [...prev, data])
+      } else if (data.type === 'backlog') {
+        setMessages((prev) => [
+          ...data.messages.map((msg: any) => ({ ...msg, type: 'message', issue_id: data.issue_id })),
+          ...prev,
+        ])
+      } else if (data.type === 'snapshot') {
+        setStatus(data.status)
+        if (data.solution) {
+          setSolution(data.solution)
+        }
       } else if (data.type === 'status') {
         setStatus(data.status)
       } else if (data.type === 'solution') {